@@ -1,12 +1,14 @@
 import httpx
+import orjson
 import asyncio
 from mcp.server.fastmcp import FastMCP
 import logging
 import os
+import sys
 import base64
 import mimetypes
 from pathlib import Path
-from typing import Optional, Dict, Union, Any, List, Callable, Awaitable
+from typing import Optional, Dict, Union, Any, List, Tuple, Callable, Awaitable
 from enum import IntEnum, Enum
 import re
 from html import escape
@@ -14,41 +16,177 @@ from pydantic import BaseModel, Field
 from functools import wraps
 import time
 from datetime import datetime
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from weakref import WeakKeyDictionary
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 
-# Initialize FastMCP server
-mcp = FastMCP("freshrelease-mcp")
+FRESHRELEASE_API_KEY: Optional[str] = None
+FRESHRELEASE_DOMAIN: Optional[str] = None
+FRESHRELEASE_PROJECT_KEY: Optional[str] = None
+
+# Request headers shared by every API call; treat as read-only
+_AUTH_HEADER: Dict[str, str] = {}
+_BASE_URL: Optional[str] = None
+
+
+def _reload_config() -> None:
+    """Read the Freshrelease settings from the environment and rebuild shared headers."""
+    global FRESHRELEASE_API_KEY, FRESHRELEASE_DOMAIN, FRESHRELEASE_PROJECT_KEY, _AUTH_HEADER, _BASE_URL
+    FRESHRELEASE_API_KEY = os.getenv("FRESHRELEASE_API_KEY")
+    FRESHRELEASE_DOMAIN = os.getenv("FRESHRELEASE_DOMAIN")
+    FRESHRELEASE_PROJECT_KEY = os.getenv("FRESHRELEASE_PROJECT_KEY")
+    _AUTH_HEADER = {
+        "Authorization": f"Token {FRESHRELEASE_API_KEY}",
+        "Content-Type": "application/json",
+    }
+    _BASE_URL = f"https://{FRESHRELEASE_DOMAIN}" if FRESHRELEASE_DOMAIN else None
+
+
+_reload_config()
+
+# Connection pool sizing; all traffic goes to a single Freshrelease host
+FRESHRELEASE_MAX_CONNECTIONS = int(os.getenv("FRESHRELEASE_MAX_CONNECTIONS", "100"))
+FRESHRELEASE_MAX_KEEPALIVE = int(os.getenv("FRESHRELEASE_MAX_KEEPALIVE", "50"))
+
+# Upper bound on concurrent requests issued by key resolution fan-outs
+FRESHRELEASE_MAX_INFLIGHT = int(os.getenv("FRESHRELEASE_MAX_INFLIGHT", "10"))
+
+# Shared HTTP clients for connection pooling, one per event loop so a client
+# is never reused on a loop other than the one its connections were opened on
+_http_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = WeakKeyDictionary()
+
+# Request semaphores, per event loop for the same reason as the clients
+_request_semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
 
-FRESHRELEASE_API_KEY = os.getenv("FRESHRELEASE_API_KEY")
-FRESHRELEASE_DOMAIN = os.getenv("FRESHRELEASE_DOMAIN")
-FRESHRELEASE_PROJECT_KEY = os.getenv("FRESHRELEASE_PROJECT_KEY")
+# Milliseconds that key lookups wait so overlapping bursts share one fan-out
+BATCH_WINDOW_MS = 5
 
-# Global HTTP client for connection pooling
-_http_client: Optional[httpx.AsyncClient] = None
+# Key lookup batchers, per event loop since they hold loop-bound futures
+_key_batchers: "WeakKeyDictionary[asyncio.AbstractEventLoop, _KeyBatcher]" = WeakKeyDictionary()
 
 # Performance metrics
 _performance_metrics: Dict[str, List[float]] = {}
 
 
 def get_http_client() -> httpx.AsyncClient:
-    """Get or create a global HTTP client for connection pooling."""
-    global _http_client
-    if _http_client is None or _http_client.is_closed:
-        _http_client = httpx.AsyncClient(
+    """Get or create the shared HTTP client for the running event loop.
+
+    The client keeps connections to the Freshrelease host alive across tool
+    calls, so only the first request pays for the TCP/TLS handshake. Requests
+    use paths relative to its base_url (see _p).
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        # Content-Type is left to httpx per request so multipart uploads keep
+        # their boundary header
+        client_headers = {"Authorization": _AUTH_HEADER["Authorization"]} if FRESHRELEASE_API_KEY else {}
+        client = httpx.AsyncClient(
+            base_url=_BASE_URL or "",
+            headers=client_headers,
             timeout=httpx.Timeout(30.0),
-            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            limits=httpx.Limits(
+                max_connections=FRESHRELEASE_MAX_CONNECTIONS,
+                max_keepalive_connections=FRESHRELEASE_MAX_KEEPALIVE,
+                keepalive_expiry=30.0
+            ),
+            http2=True
         )
-    return _http_client
+        _http_clients[loop] = client
+    return client
+
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    """Get or create the in-flight request semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _request_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(FRESHRELEASE_MAX_INFLIGHT)
+        _request_semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _bounded_get(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """GET through the shared semaphore so gathered fan-outs cannot flood the API."""
+    async with _get_request_semaphore():
+        return await client.get(url, **kwargs)
+
+
+class _KeyBatcher:
+    """Coalesce GETs for the same URL that arrive within BATCH_WINDOW_MS.
+    
+    Callers asking for a URL that is already pending share its future; the
+    whole window is then flushed as one gathered fan-out.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, Tuple[asyncio.Future, httpx.AsyncClient, Dict[str, str]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: set = set()
+
+    async def get(self, client: httpx.AsyncClient, url: str, headers: Dict[str, str]) -> httpx.Response:
+        entry = self._pending.get(url)
+        if entry is None:
+            loop = asyncio.get_running_loop()
+            entry = (loop.create_future(), client, headers)
+            self._pending[url] = entry
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(BATCH_WINDOW_MS / 1000, self._start_flush)
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(entry[0])
+
+    def _start_flush(self) -> None:
+        batch, self._pending = self._pending, {}
+        self._flush_handle = None
+        task = asyncio.ensure_future(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: Dict[str, Tuple[asyncio.Future, httpx.AsyncClient, Dict[str, str]]]) -> None:
+        responses = await asyncio.gather(*[
+            _bounded_get(client, url, headers=headers)
+            for url, (_, client, headers) in batch.items()
+        ], return_exceptions=True)
+        for (future, _, _), resp in zip(batch.values(), responses):
+            if future.done():
+                continue
+            if isinstance(resp, BaseException):
+                future.set_exception(resp)
+            else:
+                future.set_result(resp)
+
+
+def _get_key_batcher() -> _KeyBatcher:
+    """Get or create the key lookup batcher for the running event loop."""
+    loop = asyncio.get_running_loop()
+    batcher = _key_batchers.get(loop)
+    if batcher is None:
+        batcher = _KeyBatcher()
+        _key_batchers[loop] = batcher
+    return batcher
 
 
 async def close_http_client():
-    """Close the global HTTP client."""
-    global _http_client
-    if _http_client and not _http_client.is_closed:
-        await _http_client.aclose()
-        _http_client = None
+    """Close the shared HTTP client of the running event loop."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client and not client.is_closed:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def _server_lifespan(server: "FastMCP"):
+    """Close the shared HTTP client before the server's event loop shuts down."""
+    try:
+        yield {}
+    finally:
+        await close_http_client()
+
+
+# Initialize FastMCP server
+mcp = FastMCP("freshrelease-mcp", lifespan=_server_lifespan)
 
 
 def performance_monitor(func_name: str):
@@ -69,6 +207,16 @@ def performance_monitor(func_name: str):
     return decorator
 
 
+def _requires_config(func: Callable) -> Callable:
+    """Decorator returning an error response when Freshrelease credentials are not configured."""
+    @wraps(func)
+    async def async_wrapper(*args, **kwargs):
+        if not FRESHRELEASE_DOMAIN or not FRESHRELEASE_API_KEY:
+            return create_error_response("FRESHRELEASE_DOMAIN or FRESHRELEASE_API_KEY is not set")
+        return await func(*args, **kwargs)
+    return async_wrapper
+
+
 def get_performance_stats() -> Dict[str, Dict[str, float]]:
     """Get performance statistics for all monitored functions."""
     stats = {}
@@ -111,24 +259,22 @@ def get_project_identifier(project_identifier: Optional[Union[int, str]] = None)
     raise ValueError("No project identifier provided and FRESHRELEASE_PROJECT_KEY environment variable is not set")
 
 
-def validate_environment() -> Dict[str, str]:
-    """Validate required environment variables are set.
+def _norm(s: Any) -> str:
+    """Normalize a name for case-insensitive comparison."""
+    return (s if isinstance(s, str) else str(s)).strip().casefold()
+
+
+def _p(project_identifier: Union[int, str], *parts: Union[int, str]) -> str:
+    """Build a project-scoped API path relative to the shared client's base_url.
     
-    Returns:
-        Dictionary with base_url and headers if valid
+    Args:
+        project_identifier: Project ID or key
+        *parts: Path segments following the project
         
-    Raises:
-        ValueError: If required environment variables are missing
+    Returns:
+        Path such as "/FS/issues/FS-1"
     """
-    if not FRESHRELEASE_DOMAIN or not FRESHRELEASE_API_KEY:
-        raise ValueError("FRESHRELEASE_DOMAIN or FRESHRELEASE_API_KEY is not set")
-    
-    base_url = f"https://{FRESHRELEASE_DOMAIN}"
-    headers = {
-        "Authorization": f"Token {FRESHRELEASE_API_KEY}",
-        "Content-Type": "application/json",
-    }
-    return {"base_url": base_url, "headers": headers}
+    return "/" + "/".join([str(project_identifier), *map(str, parts)])
 
 
 async def make_api_request(
@@ -172,9 +318,8 @@ async def make_api_request(
             raise ValueError(f"Unsupported HTTP method: {method}")
         
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     except httpx.HTTPStatusError as e:
-        error_details = e.response.json() if e.response else None
         raise httpx.HTTPStatusError(
             f"API request failed: {str(e)}", 
             request=e.request, 
@@ -184,6 +329,36 @@ async def make_api_request(
         raise Exception(f"Unexpected error during API request: {str(e)}") from e
 
 
+def _safe_json(response: Optional[httpx.Response]) -> Any:
+    """Parse an error response body as JSON, falling back to its text.
+    
+    The result is memoized on the response, so an error that is handled at
+    several levels only parses its body once.
+    
+    Args:
+        response: HTTP response (may be None)
+        
+    Returns:
+        Parsed JSON body, raw text if the body is not JSON, or None without a
+        response or body
+    """
+    if response is None:
+        return None
+    try:
+        return response._cached_json
+    except AttributeError:
+        pass
+    if not response.content:
+        parsed = None
+    else:
+        try:
+            parsed = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            parsed = response.text
+    response._cached_json = parsed
+    return parsed
+
+
 def create_error_response(error_msg: str, details: Any = None) -> Dict[str, Any]:
     """Create standardized error response.
     
@@ -232,6 +407,30 @@ _resolution_cache: Dict[str, Dict[str, Any]] = {}
 # Cache for test case form fields
 _testcase_form_cache: Dict[str, Any] = {}
 
+# Seconds that near-immutable project configuration (issue types, sections) stays cached
+_CONFIG_CACHE_TTL = 300
+
+# Cache for project issue types: {"fetched_at": ..., "issue_types": [...], "by_label": {label: item}}
+_issue_types_cache: Dict[str, Dict[str, Any]] = {}
+
+# Cache for section lists, keyed by project and parent section:
+# {"fetched_at": ..., "sections": [...], "index": ...}; the root entry's
+# (parent_id, name) index is built by _get_section_index()
+_sections_cache: Dict[str, Dict[str, Any]] = {}
+
+# Seconds that read-only GET responses (projects, issues, test cases) stay cached
+_RESPONSE_CACHE_TTL = 60
+_RESPONSE_CACHE_MAX_SIZE = 1024
+
+# Cache for full GET responses, keyed by URL: {"fetched_at": ..., "data": ...}
+_response_cache: Dict[str, Dict[str, Any]] = {}
+
+# Cache for key -> numeric id resolutions, keyed by URL: {"fetched_at": ..., "data": id}
+_id_cache: Dict[str, Dict[str, Any]] = {}
+
+# Cache for conditional GETs, keyed by URL with query: (etag, parsed body)
+_etag_cache: Dict[str, Tuple[str, Any]] = {}
+
 
 def get_standard_fields() -> frozenset:
     """Get the set of standard Freshrelease fields that are not custom fields."""
@@ -309,6 +508,12 @@ def process_query_with_custom_fields(query_str: str, custom_fields: List[Dict[st
     return ",".join(processed_pairs)
 
 
+# Link header patterns, compiled once; negated classes avoid backtracking
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+# Lookbehind keeps "per_page=" from being read as the page number
+_PAGE_RE = re.compile(r'(?<!\w)page=(\d+)')
+
+
 def parse_link_header(link_header: str) -> Dict[str, Optional[int]]:
     """Parse the Link header to extract pagination information.
 
@@ -326,19 +531,13 @@ def parse_link_header(link_header: str) -> Dict[str, Optional[int]]:
     if not link_header:
         return pagination
 
-    # Split multiple links if present
-    links = link_header.split(',')
-
-    for link in links:
-        # Extract URL and rel
-        match = re.search(r'<(.+?)>;\s*rel="(.+?)"', link)
-        if match:
-            url, rel = match.groups()
-            # Extract page number from URL
-            page_match = re.search(r'page=(\d+)', url)
-            if page_match:
-                page_num = int(page_match.group(1))
-                pagination[rel] = page_num
+    # Single pass over the header extracts every (url, rel) pair
+    for match in _LINK_RE.finditer(link_header):
+        url, rel = match.groups()
+        # Extract page number from URL
+        page_match = _PAGE_RE.search(url)
+        if page_match:
+            pagination[rel] = int(page_match.group(1))
 
     return pagination
 
@@ -349,6 +548,7 @@ class TASK_STATUS(str, Enum):
     IN_PROGRESS = "in_progress"
     DONE = "done"
 
+@_requires_config
 async def fr_create_project(name: str, description: Optional[str] = None) -> Dict[str, Any]:
     """Create a project in Freshrelease.
     
@@ -360,12 +560,9 @@ async def fr_create_project(name: str, description: Optional[str] = None) -> Dic
         Created project data or error response
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
 
-        url = f"{base_url}/projects"
+        url = "/projects"
         payload: Dict[str, Any] = {"name": name}
         if description is not None:
             payload["description"] = description
@@ -547,6 +744,7 @@ def _generate_reproduction_steps(title: str, bug_type: str) -> str:
 
 @mcp.tool()
 @performance_monitor("fr_create_bug")
+@_requires_config
 async def fr_create_bug(
     title: str,
     bug_type: str = "bug",
@@ -612,9 +810,7 @@ async def fr_create_bug(
         issue_type_name = issue_type_mapping[bug_type]
         
         # First, get the issue type form for the specific bug type
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
         
         # Get form fields for the specific issue type
@@ -730,6 +926,7 @@ async def fr_create_bug(
 
 @mcp.tool()
 @performance_monitor("fr_get_project")
+@_requires_config
 async def fr_get_project(project_identifier: Optional[Union[int, str]] = None) -> Dict[str, Any]:
     """Get a project from Freshrelease by ID or key.
 
@@ -740,20 +937,18 @@ async def fr_get_project(project_identifier: Optional[Union[int, str]] = None) -
         Project data or error response
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
 
-        url = f"{base_url}/projects/{project_id}"
-        return await make_api_request("GET", url, headers)
+        url = f"/projects/{project_id}"
+        return await _cached_get(get_http_client(), url, headers)
 
     except Exception as e:
         return create_error_response(f"Failed to get project: {str(e)}")
 
 
 @performance_monitor("fr_create_task")
+@_requires_config
 async def fr_create_task(
     title: str,
     project_identifier: Optional[Union[int, str]] = None,
@@ -774,7 +969,7 @@ async def fr_create_task(
         assignee_id: Assignee user ID (optional)
         status: Task status (optional)
         due_date: ISO 8601 date string (e.g., 2025-12-31) (optional)
-        issue_type_name: Issue type name (e.g., "epic", "task") - defaults to "task"
+        issue_type_name: Issue type name (e.g., "epic", "task") - omit to use the project's default issue type
         user: User name or email - resolves to assignee_id if assignee_id not provided
         additional_fields: Additional fields to include in request body (optional)
         
@@ -782,10 +977,7 @@ async def fr_create_task(
         Created task data or error response
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
 
         # Build base payload
@@ -806,30 +998,40 @@ async def fr_create_task(
                 if key not in protected_keys:
                     payload[key] = value
 
-        # Resolve issue type name to ID
-        name_to_resolve = issue_type_name or "task"
-        issue_type_id = await resolve_issue_type_name_to_id(
-            get_http_client(), base_url, project_id, headers, name_to_resolve
-        )
-        payload["issue_type_id"] = issue_type_id
+        # Resolve issue type name to ID; when omitted, the API applies the
+        # project's default issue type and the lookup is skipped entirely
+        if issue_type_name:
+            issue_type_id = await resolve_issue_type_name_to_id(
+                get_http_client(), project_id, headers, issue_type_name
+            )
+            payload["issue_type_id"] = issue_type_id
 
         # Resolve user to assignee_id if applicable
         if "assignee_id" not in payload and user:
             assignee_id = await resolve_user_to_assignee_id(
-                get_http_client(), base_url, project_id, headers, user
+                get_http_client(), project_id, headers, user
             )
             payload["assignee_id"] = assignee_id
 
         # Create the task
-        url = f"{base_url}/{project_id}/issues"
-        return await make_api_request("POST", url, headers, json_data=payload)
+        url = _p(project_id, "issues")
+        result = await make_api_request("POST", url, headers, json_data=payload)
+        # A new child changes its parent, so drop the project's cached issue reads
+        _invalidate_cached_responses(prefix=f"{url}/")
+        return result
 
+    except httpx.HTTPStatusError as e:
+        # A rejected create may mean the cached issue type id is stale
+        if e.response is not None and 400 <= e.response.status_code < 500:
+            _issue_types_cache.pop(str(project_id), None)
+        return create_error_response(f"Failed to create task: {str(e)}")
     except Exception as e:
         return create_error_response(f"Failed to create task: {str(e)}")
 
 
 @mcp.tool()
 @performance_monitor("fr_get_task")
+@_requires_config
 async def fr_get_task(project_identifier: Optional[Union[int, str]] = None, key: Union[int, str] = None) -> Dict[str, Any]:
     """Get a task from Freshrelease by ID or key.
     
@@ -841,23 +1043,20 @@ async def fr_get_task(project_identifier: Optional[Union[int, str]] = None, key:
         Task data or error response
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
 
         if key is None:
             return create_error_response("key is required")
 
-        url = f"{base_url}/{project_id}/issues/{key}"
-        return await make_api_request("GET", url, headers)
+        return await _fetch_issue(get_http_client(), project_id, headers, key)
 
     except Exception as e:
         return create_error_response(f"Failed to get task: {str(e)}")
 
 @mcp.tool(name="add_notes_or_comment_in_issue")
 @performance_monitor("add_notes_or_comment_in_issue")
+@_requires_config
 async def add_notes_or_comment_in_issue(
     text: str,
     issue_key: Optional[Union[str, int]] = None,
@@ -881,9 +1080,7 @@ async def add_notes_or_comment_in_issue(
         API response with a success message, or an error dict.
     """
     try:
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
 
         resolved_id: Optional[int] = None
@@ -916,7 +1113,7 @@ async def add_notes_or_comment_in_issue(
         else:
             content = f"<p> {note} </p>"
 
-        url = f"{base_url}/{project_id}/issues/{resolved_id}/comments"
+        url = _p(project_id, "issues", resolved_id, "comments")
         payload = {"comment": {"content": content}}
         result = await make_api_request("POST", url, headers, json_data=payload)
         if isinstance(result, dict):
@@ -930,7 +1127,7 @@ async def add_notes_or_comment_in_issue(
     except httpx.HTTPStatusError as e:
         return create_error_response(
             "Failed to add note or comment",
-            e.response.json() if e.response else None,
+            _safe_json(e.response),
         )
     except Exception as e:
         return create_error_response(f"Failed to add note or comment: {str(e)}")
@@ -938,7 +1135,6 @@ async def add_notes_or_comment_in_issue(
 
 async def _upload_comment_attachment(
     client: httpx.AsyncClient,
-    base_url: str,
     project_id: Union[int, str],
     authorization: str,
     file_path: str,
@@ -952,13 +1148,13 @@ async def _upload_comment_attachment(
     mime, _ = mimetypes.guess_type(str(path))
     if not mime:
         mime = "application/octet-stream"
-    url = f"{base_url}/{project_id}/comments/null/documents"
+    url = _p(project_id, "comments", "null", "documents")
     headers = {"Authorization": authorization}
     data = {"Content-Type": mime}
     files = {"attachment": (filename, file_bytes, mime)}
     response = await client.post(url, headers=headers, data=data, files=files)
     response.raise_for_status()
-    body = response.json()
+    body = orjson.loads(response.content)
     doc = body.get("document")
     if not isinstance(doc, dict) or doc.get("id") is None:
         raise ValueError(f"Unexpected document upload response: {body}")
@@ -967,6 +1163,7 @@ async def _upload_comment_attachment(
 
 @mcp.tool(name="add_notes_or_comment_with_attachments")
 @performance_monitor("add_notes_or_comment_with_attachments")
+@_requires_config
 async def add_notes_or_comment_with_attachments(
     text: str,
     attachment_paths: Optional[List[str]] = None,
@@ -1004,9 +1201,7 @@ async def add_notes_or_comment_with_attachments(
             "Provide at least one of attachment_paths (files to upload) or document_ids"
         )
     try:
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
         authorization = headers["Authorization"]
 
@@ -1045,12 +1240,12 @@ async def add_notes_or_comment_with_attachments(
         collected_ids: List[str] = list(preset_ids)
         for p in paths:
             doc = await _upload_comment_attachment(
-                client, base_url, project_id, authorization, p
+                client, project_id, authorization, p
             )
             uploaded.append(doc)
             collected_ids.append(str(doc["id"]))
 
-        url = f"{base_url}/{project_id}/issues/{resolved_id}/comments"
+        url = _p(project_id, "issues", resolved_id, "comments")
         payload = {
             "comment": {
                 "content": content,
@@ -1076,7 +1271,7 @@ async def add_notes_or_comment_with_attachments(
     except httpx.HTTPStatusError as e:
         return create_error_response(
             "Failed to upload attachment or add note",
-            e.response.json() if e.response else None,
+            _safe_json(e.response),
         )
     except Exception as e:
         return create_error_response(f"Failed to upload attachment or add note: {str(e)}")
@@ -1084,6 +1279,7 @@ async def add_notes_or_comment_with_attachments(
 
 @mcp.tool()
 @performance_monitor("fr_get_all_tasks")
+@_requires_config
 async def fr_get_all_tasks(project_identifier: Optional[Union[int, str]] = None) -> Dict[str, Any]:
     """Get tasks/issues for a project.
     
@@ -1094,13 +1290,10 @@ async def fr_get_all_tasks(project_identifier: Optional[Union[int, str]] = None)
         List of tasks or error response (may be paginated by API - check response for total counts)
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
 
-        url = f"{base_url}/{project_id}/issues"
+        url = _p(project_id, "issues")
         return await make_api_request("GET", url, headers)
 
     except Exception as e:
@@ -1111,17 +1304,13 @@ async def fr_get_all_tasks(project_identifier: Optional[Union[int, str]] = None)
 async def _get_task_internal(project_identifier: Optional[Union[int, str]] = None, key: Union[int, str] = None) -> Dict[str, Any]:
     """Internal helper for getting task details without exposing as MCP tool."""
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
         
         if key is None:
             return create_error_response("Task key is required")
 
-        url = f"{base_url}/{project_id}/issues/{key}"
-        return await make_api_request("GET", url, headers)
+        return await _fetch_issue(get_http_client(), project_id, headers, key)
 
     except Exception as e:
         return create_error_response(f"Failed to get task: {str(e)}")
@@ -1141,6 +1330,7 @@ async def _filter_epics_internal(**kwargs) -> Any:
 
 @mcp.tool()
 @performance_monitor("fr_get_epic_insights")
+@_requires_config
 async def fr_get_epic_insights(
     epic_key: Union[int, str],
     project_identifier: Optional[Union[int, str]] = None,
@@ -1184,8 +1374,6 @@ async def fr_get_epic_insights(
         fr_get_epic_insights("FS-12345", max_tasks=0)
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
         project_id = get_project_identifier(project_identifier)
         
         logging.info(f"Fetching comprehensive insights for epic: {epic_key}")
@@ -1287,6 +1475,7 @@ async def fr_get_epic_insights(
         logging.error(error_msg)
         return create_error_response(error_msg)
 
+@_requires_config
 async def fr_get_issue_type_by_name(project_identifier: Optional[Union[int, str]] = None, issue_type_name: str = None) -> Dict[str, Any]:
     """Fetch the issue type object for a given human name within a project.
 
@@ -1298,34 +1487,19 @@ async def fr_get_issue_type_by_name(project_identifier: Optional[Union[int, str]
         Issue type data or error response
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
 
         if issue_type_name is None:
             return create_error_response("issue_type_name is required")
 
-        url = f"{base_url}/{project_id}/issue_types"
-        data = await make_api_request("GET", url, headers)
+        issue_types = await _get_project_issue_types(get_http_client(), project_id, headers)
         
-        # Handle both response formats: direct list or wrapped in "issue_types" key
-        issue_types = []
-        if isinstance(data, list):
-            issue_types = data
-        elif isinstance(data, dict) and "issue_types" in data:
-            issue_types = data["issue_types"]
-        else:
-            return create_error_response("Unexpected response structure for issue types", data)
-        
-        # Search for the issue type by label
-        if issue_types:
-            target = issue_type_name.strip().lower()
-            for item in issue_types:
-                label = str(item.get("label", "")).strip().lower()
-                if label == target:
-                    return item
+        # Look up the issue type by label
+        if issue_types["issue_types"]:
+            item = issue_types["by_label"].get(_norm(issue_type_name))
+            if item is not None:
+                return item
             return create_error_response(f"Issue type '{issue_type_name}' not found")
         
         return create_error_response("No issue types found in response")
@@ -1335,6 +1509,7 @@ async def fr_get_issue_type_by_name(project_identifier: Optional[Union[int, str]
 
 
 @mcp.tool()
+@_requires_config
 async def get_task_default_and_custom_fields(
     project_identifier: Optional[Union[int, str]] = None,
     issue_type_name: str = None
@@ -1374,21 +1549,18 @@ async def get_task_default_and_custom_fields(
         if not issue_type_id:
             return create_error_response("Could not extract issue_type_id from issue type result")
         
-        # Get environment data
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
         
         client = get_http_client()
         
         # Step 2: Get project_issue_types mapping to find form_id
-        project_issue_types_url = f"{base_url}/{project_id}/project_issue_types"
+        project_issue_types_url = _p(project_id, "project_issue_types")
         logging.info(f"Fetching project issue types from: {project_issue_types_url}")
         
         project_issue_types_response = await client.get(project_issue_types_url, headers=headers)
         project_issue_types_response.raise_for_status()
-        project_issue_types_data = project_issue_types_response.json()
+        project_issue_types_data = orjson.loads(project_issue_types_response.content)
         
         # Find the form_id for our issue_type_id
         project_issue_types_list = project_issue_types_data.get("project_issue_types", [])
@@ -1403,12 +1575,12 @@ async def get_task_default_and_custom_fields(
             return create_error_response(f"No form found for issue type '{issue_type_name}' (ID: {issue_type_id})")
         
         # Step 3: Get form details using form_id
-        form_url = f"{base_url}/{project_id}/forms/{form_id}"
+        form_url = _p(project_id, "forms", form_id)
         logging.info(f"Fetching form details from: {form_url}")
         
         form_response = await client.get(form_url, headers=headers)
         form_response.raise_for_status()
-        form_data = form_response.json()
+        form_data = orjson.loads(form_response.content)
         
         # Add metadata to the response
         result = {
@@ -1429,6 +1601,7 @@ async def get_task_default_and_custom_fields(
 
 
 @mcp.tool()
+@_requires_config
 async def fr_search_users(project_identifier: Optional[Union[int, str]] = None, search_text: str = None) -> Any:
     """Search users in a project by name or email.
 
@@ -1440,9 +1613,7 @@ async def fr_search_users(project_identifier: Optional[Union[int, str]] = None,
         List of matching users or error response
     """
     try:
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
     except ValueError as e:
         return create_error_response(str(e))
@@ -1450,41 +1621,142 @@ async def fr_search_users(project_identifier: Optional[Union[int, str]] = None,
     if search_text is None:
         return create_error_response("search_text is required")
 
-    url = f"{base_url}/{project_id}/users"
+    url = _p(project_id, "users")
     params = {"q": search_text}
 
     try:
-        return await make_api_request("GET", url, headers, params=params)
+        return await _conditional_get(get_http_client(), url, headers, params=params)
     except httpx.HTTPStatusError as e:
-        return create_error_response(f"Failed to search users: {str(e)}", e.response.json() if e.response else None)
+        return create_error_response(f"Failed to search users: {str(e)}", _safe_json(e.response))
     except Exception as e:
         return create_error_response(f"An unexpected error occurred: {str(e)}")
 
-async def issue_ids_from_keys(client: httpx.AsyncClient, base_url: str, project_identifier: Union[int, str], headers: Dict[str, str], issue_keys: List[Union[str, int]]) -> List[int]:
-    resolved: List[int] = []
-    for key in issue_keys:
-        url = f"{base_url}/{project_identifier}/issues/{key}"
-        resp = await client.get(url, headers=headers)
-        resp.raise_for_status()
-        data = resp.json()
-        if isinstance(data, dict) and "id" in data:
-            resolved.append(int(data["id"]))
+def _invalidate_cached_responses(*urls: str, prefix: Optional[str] = None) -> None:
+    """Drop cached responses for the given URLs and, optionally, every URL under a prefix.
+    
+    Key-to-id resolutions are kept, since writes do not change a resource's id.
+    """
+    for url in urls:
+        _response_cache.pop(url, None)
+    if prefix:
+        for url in [url for url in _response_cache if url.startswith(prefix)]:
+            del _response_cache[url]
+
+
+async def _cached_get(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    id_only: bool = False,
+    what: str = "resource"
+) -> Any:
+    """GET a read-only resource, cached for _RESPONSE_CACHE_TTL seconds.
+    
+    Args:
+        client: HTTP client instance
+        url: Resource URL
+        headers: Request headers
+        id_only: Cache and return only the resource's numeric "id"
+        what: Resource name used in the unexpected-structure error
+        
+    Returns:
+        Parsed response body, or its id as int when id_only is set
+        
+    Raises:
+        httpx.HTTPStatusError: For HTTP errors or a response without an id
+    """
+    now = time.monotonic()
+    cache = _id_cache if id_only else _response_cache
+    cached = cache.get(url)
+    if cached and now - cached["fetched_at"] < _RESPONSE_CACHE_TTL:
+        return cached["data"]
+
+    # A full response cached by a get tool also answers an id lookup
+    full = _response_cache.get(url) if id_only else None
+    if full and now - full["fetched_at"] < _RESPONSE_CACHE_TTL and isinstance(full["data"], dict) and "id" in full["data"]:
+        data = int(full["data"]["id"])
+    else:
+        # Id lookups fire in overlapping bursts, so they share batched fan-outs
+        if id_only:
+            resp = await _get_key_batcher().get(client, url, headers)
         else:
-            raise httpx.HTTPStatusError("Unexpected issue response structure", request=resp.request, response=resp)
-    return resolved
-
-async def testcase_id_from_key(client: httpx.AsyncClient, base_url: str, project_identifier: Union[int, str], headers: Dict[str, str], test_case_key: Union[str, int]) -> int:
-    url = f"{base_url}/{project_identifier}/test_cases/{test_case_key}"
-    resp = await client.get(url, headers=headers)
-    resp.raise_for_status()
-    data = resp.json()
-    if isinstance(data, dict) and "id" in data:
-        return int(data["id"])
-    raise httpx.HTTPStatusError("Unexpected test case response structure", request=resp.request, response=resp)
+            resp = await _bounded_get(client, url, headers=headers)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        if id_only:
+            if not (isinstance(data, dict) and "id" in data):
+                raise httpx.HTTPStatusError(f"Unexpected {what} response structure for {url}", request=resp.request, response=resp)
+            data = int(data["id"])
+
+    cache.pop(url, None)
+    if len(cache) >= _RESPONSE_CACHE_MAX_SIZE:
+        # Dicts keep insertion order, so the first entry is the oldest
+        del cache[next(iter(cache))]
+    cache[url] = {"fetched_at": time.monotonic(), "data": data}
+    return data
+
+
+async def _conditional_get(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    params: Optional[Dict[str, Any]] = None
+) -> Any:
+    """GET with If-None-Match so unchanged responses come back as 304 Not Modified.
+    
+    The TTL caches bound staleness; this makes their refreshes cheap.
+    
+    Args:
+        client: HTTP client instance
+        url: Request URL
+        headers: Request headers
+        params: Query parameters
+        
+    Returns:
+        Parsed response body, reused from the last 200 on a 304
+        
+    Raises:
+        httpx.HTTPStatusError: For HTTP errors
+    """
+    cache_key = str(httpx.URL(url, params=params))
+    cached = _etag_cache.get(cache_key)
+    request_headers = {**headers, "If-None-Match": cached[0]} if cached else headers
+    
+    response = await client.get(url, headers=request_headers, params=params)
+    if response.status_code == 304 and cached:
+        return cached[1]
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    etag = response.headers.get("etag")
+    if etag:
+        _etag_cache.pop(cache_key, None)
+        if len(_etag_cache) >= _RESPONSE_CACHE_MAX_SIZE:
+            del _etag_cache[next(iter(_etag_cache))]
+        _etag_cache[cache_key] = (etag, data)
+    else:
+        _etag_cache.pop(cache_key, None)
+    return data
+
+
+async def _fetch_issue(client: httpx.AsyncClient, project_identifier: Union[int, str], headers: Dict[str, str], key: Union[str, int], id_only: bool = False) -> Any:
+    return await _cached_get(client, _p(project_identifier, "issues", key), headers, id_only=id_only, what="issue")
+
+async def _fetch_testcase(client: httpx.AsyncClient, project_identifier: Union[int, str], headers: Dict[str, str], key: Union[str, int], id_only: bool = False) -> Any:
+    return await _cached_get(client, _p(project_identifier, "test_cases", key), headers, id_only=id_only, what="test case")
+
+async def issue_ids_from_keys(client: httpx.AsyncClient, project_identifier: Union[int, str], headers: Dict[str, str], issue_keys: List[Union[str, int]]) -> List[int]:
+    # Fetch all uncached issues concurrently over the pooled connection
+    return list(await asyncio.gather(*[
+        _fetch_issue(client, project_identifier, headers, key, id_only=True)
+        for key in issue_keys
+    ]))
+
+async def testcase_id_from_key(client: httpx.AsyncClient, project_identifier: Union[int, str], headers: Dict[str, str], test_case_key: Union[str, int]) -> int:
+    return await _fetch_testcase(client, project_identifier, headers, test_case_key, id_only=True)
 
 async def resolve_user_to_assignee_id(
     client: httpx.AsyncClient, 
-    base_url: str, 
     project_identifier: Union[int, str], 
     headers: Dict[str, str], 
     user: str
@@ -1493,7 +1765,6 @@ async def resolve_user_to_assignee_id(
     
     Args:
         client: HTTP client instance
-        base_url: API base URL
         project_identifier: Project identifier
         headers: Request headers
         user: User name or email to resolve
@@ -1505,12 +1776,10 @@ async def resolve_user_to_assignee_id(
         ValueError: If no matching user found
         httpx.HTTPStatusError: For API errors
     """
-    users_url = f"{base_url}/{project_identifier}/users"
+    users_url = _p(project_identifier, "users")
     params = {"q": user}
     
-    response = await client.get(users_url, headers=headers, params=params)
-    response.raise_for_status()
-    users_data = response.json()
+    users_data = await _conditional_get(client, users_url, headers, params=params)
     
     # Handle nested response structure {"users": [...], "meta": {...}}
     users_list = None
@@ -1524,27 +1793,25 @@ async def resolve_user_to_assignee_id(
     if not users_list:
         raise ValueError(f"No users found matching '{user}'")
     
-    lowered = user.strip().lower()
+    lowered = _norm(user)
     
-    # Prefer exact email match
+    # Single pass: an exact email match wins outright, otherwise the first
+    # exact name match, otherwise the first result
+    name_hit = None
     for item in users_list:
-        email = str(item.get("email", "")).strip().lower()
+        email = _norm(item.get("email", ""))
         if email and email == lowered:
             return item.get("id")
+        if name_hit is None:
+            name_val = _norm(item.get("name", ""))
+            if name_val and name_val == lowered:
+                name_hit = item
     
-    # Then exact name match
-    for item in users_list:
-        name_val = str(item.get("name", "")).strip().lower()
-        if name_val and name_val == lowered:
-            return item.get("id")
-    
-    # Fallback to first result
-    return users_list[0].get("id")
+    return (name_hit or users_list[0]).get("id")
 
 
 async def resolve_issue_type_name_to_id(
     client: httpx.AsyncClient,
-    base_url: str,
     project_identifier: Union[int, str],
     headers: Dict[str, str],
     issue_type_name: str
@@ -1553,7 +1820,6 @@ async def resolve_issue_type_name_to_id(
     
     Args:
         client: HTTP client instance
-        base_url: API base URL
         project_identifier: Project identifier
         headers: Request headers
         issue_type_name: Issue type name to resolve (matches against label field)
@@ -1565,26 +1831,146 @@ async def resolve_issue_type_name_to_id(
         ValueError: If issue type not found
         httpx.HTTPStatusError: For API errors
     """
-    issue_types_url = f"{base_url}/{project_identifier}/issue_types"
-    response = await client.get(issue_types_url, headers=headers)
-    response.raise_for_status()
-    it_data = response.json()
+    issue_types = await _get_project_issue_types(client, project_identifier, headers)
+    item = issue_types["by_label"].get(_norm(issue_type_name))
+    if item is not None:
+        return item.get("id")
+    
+    raise ValueError(f"Issue type with label '{issue_type_name}' not found")
+
+
+async def _get_project_issue_types(
+    client: httpx.AsyncClient,
+    project_identifier: Union[int, str],
+    headers: Dict[str, str]
+) -> Dict[str, Any]:
+    """Get the project's issue types, cached for _CONFIG_CACHE_TTL seconds.
+    
+    Args:
+        client: HTTP client instance
+        project_identifier: Project identifier
+        headers: Request headers
+        
+    Returns:
+        Dictionary with the raw "issue_types" list and a "by_label" index of
+        normalized label to issue type (first match wins, as in a linear scan)
+        
+    Raises:
+        ValueError: For unexpected response structure
+        httpx.HTTPStatusError: For API errors
+    """
+    cache_key = str(project_identifier)
+    cached = _issue_types_cache.get(cache_key)
+    if cached and time.monotonic() - cached["fetched_at"] < _CONFIG_CACHE_TTL:
+        return cached
     
-    types_list = it_data.get("issue_types", []) if isinstance(it_data, dict) else []
-    target = issue_type_name.strip().lower()
+    try:
+        data = await _conditional_get(client, _p(project_identifier, "issue_types"), headers)
+    except httpx.HTTPStatusError as e:
+        if 400 <= e.response.status_code < 500:
+            _issue_types_cache.pop(cache_key, None)
+        raise
     
-    for t in types_list:
-        label = str(t.get("label", "")).strip().lower()
-        if label == target:
-            return t.get("id")
+    # Handle both response formats: direct list or wrapped in "issue_types" key
+    if isinstance(data, list):
+        types_list = data
+    elif isinstance(data, dict) and "issue_types" in data:
+        types_list = data["issue_types"]
+    else:
+        raise ValueError(f"Unexpected response structure for issue types: {data}")
     
-    raise ValueError(f"Issue type with label '{issue_type_name}' not found")
+    by_label: Dict[str, Dict[str, Any]] = {}
+    for item in types_list:
+        # Unlabeled types can never match a name, so keep them out of the index
+        if isinstance(item, dict) and item.get("label"):
+            by_label.setdefault(_norm(item["label"]), item)
+    
+    cached = {"fetched_at": time.monotonic(), "issue_types": types_list, "by_label": by_label}
+    _issue_types_cache[cache_key] = cached
+    return cached
 
 
-async def resolve_section_hierarchy_to_ids(client: httpx.AsyncClient, base_url: str, project_identifier: Union[int, str], headers: Dict[str, str], section_path: str) -> List[int]:
+async def _get_sections(
+    client: httpx.AsyncClient,
+    project_identifier: Union[int, str],
+    headers: Dict[str, str],
+    parent_section_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Get sections at one hierarchy level, cached for _CONFIG_CACHE_TTL seconds.
+    
+    Args:
+        client: HTTP client instance
+        project_identifier: Project ID or key
+        headers: Request headers
+        parent_section_id: Parent section ID (None for root level)
+        
+    Returns:
+        List of sections at the specified level
+        
+    Raises:
+        httpx.HTTPStatusError: For API errors
+        ValueError: For unexpected response structure
+    """
+    cache_key = f"{project_identifier}:{parent_section_id}"
+    cached = _sections_cache.get(cache_key)
+    if cached and time.monotonic() - cached["fetched_at"] < _CONFIG_CACHE_TTL:
+        return cached["sections"]
+    
+    try:
+        sections = await _fetch_sections_at_level(client, project_identifier, headers, parent_section_id)
+    except httpx.HTTPStatusError as e:
+        if 400 <= e.response.status_code < 500:
+            _sections_cache.pop(cache_key, None)
+        raise
+    
+    entry = {"fetched_at": time.monotonic(), "sections": sections}
+    # A 304 revalidation hands back the same list, so its index stays valid
+    if cached and cached["sections"] is sections and "index" in cached:
+        entry["index"] = cached["index"]
+    _sections_cache[cache_key] = entry
+    return sections
+
+
+async def _get_section_index(
+    client: httpx.AsyncClient,
+    project_identifier: Union[int, str],
+    headers: Dict[str, str]
+) -> Dict[Tuple[Optional[int], str], List[int]]:
+    """Get the project's section index, built once per _CONFIG_CACHE_TTL window.
+    
+    Args:
+        client: HTTP client instance
+        project_identifier: Project ID or key
+        headers: Request headers
+        
+    Returns:
+        Index from _index_sections() of the root section tree
+        
+    Raises:
+        httpx.HTTPStatusError: For API errors
+        ValueError: For unexpected response structure
+    """
+    sections = await _get_sections(client, project_identifier, headers)
+    cached = _sections_cache.get(f"{project_identifier}:None")
+    if cached is None or cached["sections"] is not sections:
+        return _index_sections(sections)
+    if "index" not in cached:
+        cached["index"] = _index_sections(sections)
+    return cached["index"]
+
+
+async def resolve_section_hierarchy_to_ids(
+    client: httpx.AsyncClient,
+    project_identifier: Union[int, str],
+    headers: Dict[str, str],
+    section_path: str,
+    section_index: Optional[Dict[Tuple[Optional[int], str], List[int]]] = None
+) -> List[int]:
     """Resolve a section hierarchy path like 'level1 --> level2 --> level3' to the final section ID.
     
-    Navigates through section hierarchy level by level using the API:
+    When a prebuilt section_index is given the path is first resolved in memory;
+    otherwise (or if the index does not contain the path) it navigates through
+    the section hierarchy level by level using the API:
     /{Project_identifier}/sections/{level}/sections
     
     Supports up to 7 levels of nesting.
@@ -1592,10 +1978,10 @@ async def resolve_section_hierarchy_to_ids(client: httpx.AsyncClient, base_url:
     
     Args:
         client: HTTP client instance
-        base_url: API base URL  
         project_identifier: Project ID or key
         headers: Request headers
         section_path: Hierarchy path like "Authentication --> Login Tests --> Positive Cases"
+        section_index: Optional index from _get_section_index() of an already fetched section tree
         
     Returns:
         List containing the ID of the final section, or empty list if not found
@@ -1614,6 +2000,13 @@ async def resolve_section_hierarchy_to_ids(client: httpx.AsyncClient, base_url:
     if len(path_parts) > 7:
         raise ValueError(f"Section hierarchy exceeds maximum depth of 7 levels. Got {len(path_parts)} levels.")
     
+    # Resolve in memory when the caller already indexed the section tree
+    if section_index is not None:
+        matches = _walk_section_index(section_index, [_norm(part) for part in path_parts])
+        matches = [sid for sid in matches if isinstance(sid, int)]
+        if matches:
+            return [matches[0]]
+    
     # Navigate through hierarchy levels
     current_parent_id = None
     
@@ -1621,7 +2014,7 @@ async def resolve_section_hierarchy_to_ids(client: httpx.AsyncClient, base_url:
         is_final_level = level_index == len(path_parts) - 1
         
         # Fetch sections at current level
-        sections = await _fetch_sections_at_level(client, base_url, project_identifier, headers, current_parent_id)
+        sections = await _get_sections(client, project_identifier, headers, current_parent_id)
         
         # Find matching section (case-insensitive)
         section_id = _find_section_by_name(sections, section_name)
@@ -1652,11 +2045,11 @@ def _find_section_by_name(sections: List[Dict[str, Any]], target_name: str) -> O
     Returns:
         Section ID if found, None otherwise
     """
-    target_lower = target_name.lower()
+    target_lower = _norm(target_name)
     
     for section in sections:
         section_name = section.get("name")
-        if section_name and str(section_name).strip().lower() == target_lower:
+        if section_name and _norm(section_name) == target_lower:
             section_id = section.get("id")
             return section_id if isinstance(section_id, int) else None
     
@@ -1665,7 +2058,6 @@ def _find_section_by_name(sections: List[Dict[str, Any]], target_name: str) -> O
 
 async def _fetch_sections_at_level(
     client: httpx.AsyncClient, 
-    base_url: str, 
     project_identifier: Union[int, str], 
     headers: Dict[str, str], 
     parent_section_id: Optional[int]
@@ -1674,7 +2066,6 @@ async def _fetch_sections_at_level(
     
     Args:
         client: HTTP client instance
-        base_url: API base URL
         project_identifier: Project ID or key  
         headers: Request headers
         parent_section_id: Parent section ID (None for root level)
@@ -1688,14 +2079,12 @@ async def _fetch_sections_at_level(
     """
     # Build URL based on hierarchy level
     if parent_section_id is None:
-        url = f"{base_url}/{project_identifier}/sections"
+        url = _p(project_identifier, "sections")
     else:
-        url = f"{base_url}/{project_identifier}/sections/{parent_section_id}/sections"
+        url = _p(project_identifier, "sections", parent_section_id, "sections")
     
     # Fetch and parse response
-    resp = await client.get(url, headers=headers)
-    resp.raise_for_status()
-    data = resp.json()
+    data = await _conditional_get(client, url, headers)
     
     # Extract sections list from various response formats
     if isinstance(data, list):
@@ -1712,6 +2101,7 @@ async def _fetch_sections_at_level(
     raise ValueError(f"Unexpected sections API response structure: {type(data)}")
 
 @mcp.tool()
+@_requires_config
 async def fr_list_testcases(project_identifier: Optional[Union[int, str]] = None) -> Any:
     """List test cases in a project.
 
@@ -1722,23 +2112,22 @@ async def fr_list_testcases(project_identifier: Optional[Union[int, str]] = None
         List of test cases or error response (may be paginated by API - check response for total counts)
     """
     try:
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
     except ValueError as e:
         return create_error_response(str(e))
 
-    url = f"{base_url}/{project_id}/test_cases"
+    url = _p(project_id, "test_cases")
 
     try:
-        return await make_api_request("GET", url, headers)
+        return await _cached_get(get_http_client(), url, headers)
     except httpx.HTTPStatusError as e:
-        return create_error_response(f"Failed to list test cases: {str(e)}", e.response.json() if e.response else None)
+        return create_error_response(f"Failed to list test cases: {str(e)}", _safe_json(e.response))
     except Exception as e:
         return create_error_response(f"An unexpected error occurred: {str(e)}")
 
 @mcp.tool()
+@_requires_config
 async def fr_get_testcase(project_identifier: Optional[Union[int, str]] = None, test_case_key: Union[str, int] = None) -> Any:
     """Get a specific test case by key or ID.
 
@@ -1750,9 +2139,7 @@ async def fr_get_testcase(project_identifier: Optional[Union[int, str]] = None,
         Test case data or error response
     """
     try:
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
     except ValueError as e:
         return create_error_response(str(e))
@@ -1760,16 +2147,15 @@ async def fr_get_testcase(project_identifier: Optional[Union[int, str]] = None,
     if test_case_key is None:
         return create_error_response("test_case_key is required")
 
-    url = f"{base_url}/{project_id}/test_cases/{test_case_key}"
-
     try:
-        return await make_api_request("GET", url, headers)
+        return await _fetch_testcase(get_http_client(), project_id, headers, test_case_key)
     except httpx.HTTPStatusError as e:
-        return create_error_response(f"Failed to get test case: {str(e)}", e.response.json() if e.response else None)
+        return create_error_response(f"Failed to get test case: {str(e)}", _safe_json(e.response))
     except Exception as e:
         return create_error_response(f"An unexpected error occurred: {str(e)}")
 
 @mcp.tool()
+@_requires_config
 async def fr_link_testcase_issues(project_identifier: Optional[Union[int, str]] = None, testcase_keys: List[Union[str, int]] = None, issue_keys: List[Union[str, int]] = None) -> Any:
     """Bulk update multiple test cases with issue links by keys.
 
@@ -1782,9 +2168,7 @@ async def fr_link_testcase_issues(project_identifier: Optional[Union[int, str]]
         Update result or error response
     """
     try:
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
     except ValueError as e:
         return create_error_response(str(e))
@@ -1792,27 +2176,36 @@ async def fr_link_testcase_issues(project_identifier: Optional[Union[int, str]]
     if testcase_keys is None or issue_keys is None:
         return create_error_response("testcase_keys and issue_keys are required")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # Resolve testcase keys to ids
-            resolved_testcase_ids: List[int] = []
-            for key in testcase_keys:
-                resolved_testcase_ids.append(await testcase_id_from_key(client, base_url, project_id, headers, key))
-            
-            # Resolve issue keys to ids
-            resolved_issue_ids = await issue_ids_from_keys(client, base_url, project_id, headers, issue_keys)
-            
-            # Perform bulk update
-            url = f"{base_url}/{project_id}/test_cases/update_many"
-            payload = {"ids": resolved_testcase_ids, "test_case": {"issue_ids": resolved_issue_ids}}
-            
-            return await make_api_request("PUT", url, headers, json_data=payload, client=client)
-        except httpx.HTTPStatusError as e:
-            return create_error_response(f"Failed to bulk update testcases: {str(e)}", e.response.json() if e.response else None)
-        except Exception as e:
-            return create_error_response(f"An unexpected error occurred: {str(e)}")
+    client = get_http_client()
+    try:
+        # Resolve testcase keys to ids
+        resolved_testcase_ids: List[int] = list(await asyncio.gather(*[
+            testcase_id_from_key(client, project_id, headers, key)
+            for key in testcase_keys
+        ]))
+        
+        # Resolve issue keys to ids
+        resolved_issue_ids = await issue_ids_from_keys(client, project_id, headers, issue_keys)
+        
+        # Perform bulk update
+        url = _p(project_id, "test_cases", "update_many")
+        payload = {"ids": resolved_testcase_ids, "test_case": {"issue_ids": resolved_issue_ids}}
+        
+        result = await make_api_request("PUT", url, headers, json_data=payload, client=client)
+        # Linked test cases and issues now read differently
+        _invalidate_cached_responses(
+            _p(project_id, "test_cases"),
+            *[_p(project_id, "test_cases", key) for key in testcase_keys],
+            *[_p(project_id, "issues", key) for key in issue_keys]
+        )
+        return result
+    except httpx.HTTPStatusError as e:
+        return create_error_response(f"Failed to bulk update testcases: {str(e)}", _safe_json(e.response))
+    except Exception as e:
+        return create_error_response(f"An unexpected error occurred: {str(e)}")
 
 @mcp.tool()
+@_requires_config
 async def fr_get_testcases_by_section(project_identifier: Optional[Union[int, str]] = None, section_name: str = None) -> Any:
     """Get test cases that belong to a section (by name) and its sub-sections.
 
@@ -1824,9 +2217,7 @@ async def fr_get_testcases_by_section(project_identifier: Optional[Union[int, st
         List of test cases in the section or error response
     """
     try:
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
     except ValueError as e:
         return create_error_response(str(e))
@@ -1834,46 +2225,49 @@ async def fr_get_testcases_by_section(project_identifier: Optional[Union[int, st
     if section_name is None:
         return create_error_response("section_name is required")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # 1) Fetch sections and find matching id(s)
-            sections_url = f"{base_url}/{project_id}/sections"
-            sections = await make_api_request("GET", sections_url, headers, client=client)
-
-            target = section_name.strip().lower()
-            matched_ids: List[int] = []
-            if isinstance(sections, list):
-                for sec in sections:
-                    name_val = str(sec.get("name", "")).strip().lower()
-                    if name_val == target:
-                        sec_id = sec.get("id")
-                        if isinstance(sec_id, int):
-                            matched_ids.append(sec_id)
+    client = get_http_client()
+    try:
+        # 1) Fetch sections and find matching id(s)
+        sections = await _get_sections(client, project_id, headers)
+
+        target = _norm(section_name)
+        matched_ids: List[int] = []
+        if isinstance(sections, list):
+            for sec in sections:
+                if _norm(sec.get("name", "")) == target:
+                    sec_id = sec.get("id")
+                    if isinstance(sec_id, int):
+                        matched_ids.append(sec_id)
+        else:
+            return create_error_response("Unexpected sections response structure", sections)
+
+        if not matched_ids:
+            return create_error_response(f"Section named '{section_name}' not found")
+
+        # 2) Fetch test cases for each matched section subtree and merge results
+        testcases_url = _p(project_id, "test_cases")
+        all_results: List[Any] = []
+        # Bounded like the other fan-outs, since a common name can match many sections
+        responses = await asyncio.gather(*[
+            _bounded_get(client, testcases_url, headers=headers, params=[("section_subtree_ids[]", str(sid))])
+            for sid in matched_ids
+        ])
+        
+        for response in responses:
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            if isinstance(data, list):
+                all_results.extend(data)
             else:
-                return create_error_response("Unexpected sections response structure", sections)
-
-            if not matched_ids:
-                return create_error_response(f"Section named '{section_name}' not found")
-
-            # 2) Fetch test cases for each matched section subtree and merge results
-            testcases_url = f"{base_url}/{project_id}/test_cases"
-            all_results: List[Any] = []
-            
-            for sid in matched_ids:
-                params = [("section_subtree_ids[]", str(sid))]
-                data = await make_api_request("GET", testcases_url, headers, params=params, client=client)
-                if isinstance(data, list):
-                    all_results.extend(data)
-                else:
-                    # If API returns an object, append as-is for transparency
-                    all_results.append(data)
+                # If API returns an object, append as-is for transparency
+                all_results.append(data)
 
-            return all_results
+        return all_results
 
-        except httpx.HTTPStatusError as e:
-            return create_error_response(f"Failed to fetch test cases for section: {str(e)}", e.response.json() if e.response else None)
-        except Exception as e:
-            return create_error_response(f"An unexpected error occurred: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        return create_error_response(f"Failed to fetch test cases for section: {str(e)}", _safe_json(e.response))
+    except Exception as e:
+        return create_error_response(f"An unexpected error occurred: {str(e)}")
 
 async def _get_project_fields_mapping(
     project_id: Union[int, str],
@@ -1896,19 +2290,17 @@ async def _get_project_fields_mapping(
     """
     try:
         # Get all issue types to find one to use for form fields
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         
         client = get_http_client()
         
         # Get issue types
-        issue_types_url = f"{base_url}/{project_id}/issue_types"
+        issue_types_url = _p(project_id, "issue_types")
         logging.info(f"Fetching issue types from: {issue_types_url}")
         
         response = await client.get(issue_types_url, headers=headers)
         response.raise_for_status()
-        issue_types_data = response.json()
+        issue_types_data = orjson.loads(response.content)
         
         logging.info(f"Issue types response: {issue_types_data}")
         
@@ -2008,6 +2400,7 @@ async def _get_project_fields_mapping(
 
 @mcp.tool()
 @performance_monitor("fr_filter_tasks")
+@_requires_config
 async def fr_filter_tasks(
     project_identifier: Optional[Union[int, str]] = None,
     query: Optional[Union[str, Dict[str, Any]]] = None,
@@ -2111,10 +2504,7 @@ async def fr_filter_tasks(
         - Supports all native Freshrelease operators: "is", "is_in", "is_in_the_range", "contains", etc.
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
 
         # Build base parameters
@@ -2140,52 +2530,51 @@ async def fr_filter_tasks(
 
         # Handle native query_hash format (highest priority)
         if query_hash:
-            async with httpx.AsyncClient() as client:
-                # Get form fields for value resolution
-                fields_info = await _get_project_fields_mapping(project_id, project_identifier)
-                if "error" in fields_info:
-                    return fields_info
-                
-                field_label_to_name_map = fields_info["field_label_to_name_map"]
-                custom_fields = fields_info["custom_fields"]
+            client = get_http_client()
+            # Get form fields for value resolution
+            fields_info = await _get_project_fields_mapping(project_id, project_identifier)
+            if "error" in fields_info:
+                return fields_info
+            
+            field_label_to_name_map = fields_info["field_label_to_name_map"]
+            custom_fields = fields_info["custom_fields"]
+            
+            for i, query_item in enumerate(query_hash):
+                condition = query_item.get("condition")
+                operator = query_item.get("operator")
+                value = query_item.get("value")
                 
-                for i, query_item in enumerate(query_hash):
-                    condition = query_item.get("condition")
-                    operator = query_item.get("operator")
-                    value = query_item.get("value")
+                if condition and operator and value is not None:
+                    params[f"query_hash[{i}][condition]"] = condition
+                    params[f"query_hash[{i}][operator]"] = operator
                     
-                    if condition and operator and value is not None:
-                        params[f"query_hash[{i}][condition]"] = condition
-                        params[f"query_hash[{i}][operator]"] = operator
-                        
-                        # Resolve values to IDs if needed
-                        resolved_values = await _resolve_query_fields(
-                            [(condition, value)], 
-                            project_id, 
-                            client, 
-                            base_url, 
-                            headers,
-                            custom_fields,
-                            field_label_to_name_map
-                        )
-                        final_value = resolved_values.get(condition, value)
-                        
-                        # Handle array values
-                        if isinstance(final_value, list):
-                            for val in final_value:
-                                key = f"query_hash[{i}][value][]"
-                                if key in params:
-                                    # Convert to list if multiple values
-                                    if not isinstance(params[key], list):
-                                        params[key] = [params[key]]
-                                    params[key].append(val)
-                                else:
-                                    params[key] = val
-                        else:
-                            params[f"query_hash[{i}][value]"] = final_value
-            
+                    # Resolve values to IDs if needed
+                    resolved_values = await _resolve_query_fields(
+                        [(condition, value)], 
+                        project_id, 
+                        client, 
+                        headers,
+                        custom_fields,
+                        field_label_to_name_map
+                    )
+                    final_value = resolved_values.get(condition, value)
+                    
+                    # Handle array values
+                    if isinstance(final_value, list):
+                        for val in final_value:
+                            key = f"query_hash[{i}][value][]"
+                            if key in params:
+                                # Convert to list if multiple values
+                                if not isinstance(params[key], list):
+                                    params[key] = [params[key]]
+                                params[key].append(val)
+                            else:
+                                params[key] = val
+                    else:
+                        params[f"query_hash[{i}][value]"] = final_value
+
             # Make API request with query_hash
-            url = f"{base_url}/{project_id}/issues"
+            url = _p(project_id, "issues")
             result = await make_api_request("GET", url, headers, params=params)
             return result
 
@@ -2211,101 +2600,38 @@ async def fr_filter_tasks(
 
         # Handle legacy query parameter format (only if query is provided and not empty)
         if query and str(query).strip():
-            async with httpx.AsyncClient() as client:
-                # Get form fields (standard and custom) for the project to process query properly
-                fields_info = await _get_project_fields_mapping(project_id, project_identifier)
-                if "error" in fields_info:
-                    return fields_info
-                
-                field_label_to_name_map = fields_info["field_label_to_name_map"]
-                custom_fields = fields_info["custom_fields"]
-                
-                # Parse query based on format
-                if query_format == "json":
-                    if isinstance(query, str):
-                        import json
-                        query_dict = json.loads(query)
-                    else:
-                        query_dict = query
-                    query_pairs = list(query_dict.items())
+            client = get_http_client()
+            # Get form fields (standard and custom) for the project to process query properly
+            fields_info = await _get_project_fields_mapping(project_id, project_identifier)
+            if "error" in fields_info:
+                return fields_info
+            
+            field_label_to_name_map = fields_info["field_label_to_name_map"]
+            custom_fields = fields_info["custom_fields"]
+            
+            # Parse query based on format
+            if query_format == "json":
+                if isinstance(query, str):
+                    query_dict = orjson.loads(query)
                 else:
-                    # Comma-separated format (only process if applicable)
-                    processed_query_str = process_query_with_custom_fields(query, custom_fields)
-                    query_pairs = parse_query_string(processed_query_str)
-                
-                    # Skip processing if no valid query pairs found
-                    if not query_pairs:
-                        logging.info(f"No valid query pairs found in: '{query}' - skipping comma-separated processing")
-                        # Continue to other filtering methods
-                    else:
-                        logging.info(f"Processing {len(query_pairs)} comma-separated query pairs: {query_pairs}")
-                
-                # Convert query_pairs to query_hash format (only if we have valid pairs)
-                query_hash_items = []
-                if query_pairs:
-                    for i, (field, value) in enumerate(query_pairs):
-                        # Map field label to name if needed (case-insensitive)
-                        field_lower = field.lower()
-                        if field_lower in field_label_to_name_map:
-                            original_field = field
-                            field = field_label_to_name_map[field_lower]
-                            logging.info(f"Mapped field label '{original_field}' to field name '{field}'")
-                        else:
-                            logging.info(f"Field '{field}' not found in label mapping, using as-is")
-                        
-                        # Determine operator based on value type
-                        if isinstance(value, list):
-                            operator = "is_in"
-                        else:
-                            operator = "is"
-                        
-                        query_hash_items.append({
-                            "condition": field,
-                            "operator": operator,
-                            "value": value
-                        })
-                
-                # Build query_hash parameters (only if we have items to process)
-                if query_hash_items:
-                    for i, query_item in enumerate(query_hash_items):
-                        condition = query_item.get("condition")
-                        operator = query_item.get("operator") 
-                        value = query_item.get("value")
-                        
-                        params[f"query_hash[{i}][condition]"] = condition
-                        params[f"query_hash[{i}][operator]"] = operator
-                        
-                        if isinstance(value, list):
-                            for val in value:
-                                key = f"query_hash[{i}][value][]"
-                                if key in params:
-                                    if not isinstance(params[key], list):
-                                        params[key] = [params[key]]
-                                    params[key].append(val)
-                                else:
-                                    params[key] = val
-                        else:
-                            params[f"query_hash[{i}][value]"] = value
-                
-                # Make API request with converted query
-                url = f"{base_url}/{project_id}/issues"
-                result = await make_api_request("GET", url, headers, params=params)
-                return result
-
-        # Handle individual field parameters
-        if field_params:
-            async with httpx.AsyncClient() as client:
-                # Get form fields (standard and custom) for individual parameter processing
-                fields_info = await _get_project_fields_mapping(project_id, project_identifier)
-                if "error" in fields_info:
-                    return fields_info
-                
-                field_label_to_name_map = fields_info["field_label_to_name_map"]
-                custom_fields = fields_info["custom_fields"]
-                
-                # Convert field_params to query_hash format
-                query_hash_items = []
-                for i, (field, value) in enumerate(field_params.items()):
+                    query_dict = query
+                query_pairs = list(query_dict.items())
+            else:
+                # Comma-separated format (only process if applicable)
+                processed_query_str = process_query_with_custom_fields(query, custom_fields)
+                query_pairs = parse_query_string(processed_query_str)
+            
+                # Skip processing if no valid query pairs found
+                if not query_pairs:
+                    logging.info(f"No valid query pairs found in: '{query}' - skipping comma-separated processing")
+                    # Continue to other filtering methods
+                else:
+                    logging.info(f"Processing {len(query_pairs)} comma-separated query pairs: {query_pairs}")
+            
+            # Convert query_pairs to query_hash format (only if we have valid pairs)
+            query_hash_items = []
+            if query_pairs:
+                for i, (field, value) in enumerate(query_pairs):
                     # Map field label to name if needed (case-insensitive)
                     field_lower = field.lower()
                     if field_lower in field_label_to_name_map:
@@ -2326,11 +2652,12 @@ async def fr_filter_tasks(
                         "operator": operator,
                         "value": value
                     })
-                
-                # Build query_hash parameters
+            
+            # Build query_hash parameters (only if we have items to process)
+            if query_hash_items:
                 for i, query_item in enumerate(query_hash_items):
                     condition = query_item.get("condition")
-                    operator = query_item.get("operator")
+                    operator = query_item.get("operator") 
                     value = query_item.get("value")
                     
                     params[f"query_hash[{i}][condition]"] = condition
@@ -2347,15 +2674,77 @@ async def fr_filter_tasks(
                                 params[key] = val
                     else:
                         params[f"query_hash[{i}][value]"] = value
+            
+            # Make API request with converted query
+            url = _p(project_id, "issues")
+            result = await make_api_request("GET", url, headers, params=params)
+            return result
+
+        # Handle individual field parameters
+        if field_params:
+            client = get_http_client()
+            # Get form fields (standard and custom) for individual parameter processing
+            fields_info = await _get_project_fields_mapping(project_id, project_identifier)
+            if "error" in fields_info:
+                return fields_info
+            
+            field_label_to_name_map = fields_info["field_label_to_name_map"]
+            custom_fields = fields_info["custom_fields"]
+            
+            # Convert field_params to query_hash format
+            query_hash_items = []
+            for i, (field, value) in enumerate(field_params.items()):
+                # Map field label to name if needed (case-insensitive)
+                field_lower = field.lower()
+                if field_lower in field_label_to_name_map:
+                    original_field = field
+                    field = field_label_to_name_map[field_lower]
+                    logging.info(f"Mapped field label '{original_field}' to field name '{field}'")
+                else:
+                    logging.info(f"Field '{field}' not found in label mapping, using as-is")
+                
+                # Determine operator based on value type
+                if isinstance(value, list):
+                    operator = "is_in"
+                else:
+                    operator = "is"
+                
+                query_hash_items.append({
+                    "condition": field,
+                    "operator": operator,
+                    "value": value
+                })
+            
+            # Build query_hash parameters
+            for i, query_item in enumerate(query_hash_items):
+                condition = query_item.get("condition")
+                operator = query_item.get("operator")
+                value = query_item.get("value")
+                
+                params[f"query_hash[{i}][condition]"] = condition
+                params[f"query_hash[{i}][operator]"] = operator
+                
+                if isinstance(value, list):
+                    for val in value:
+                        key = f"query_hash[{i}][value][]"
+                        if key in params:
+                            if not isinstance(params[key], list):
+                                params[key] = [params[key]]
+                            params[key].append(val)
+                        else:
+                            params[key] = val
+                else:
+                    params[f"query_hash[{i}][value]"] = value
 
         # Make the API request - use /issues endpoint with query_hash format
-        url = f"{base_url}/{project_id}/issues"
+        url = _p(project_id, "issues")
         result = await make_api_request("GET", url, headers, params=params)
         return result
 
     except Exception as e:
         return create_error_response(f"Failed to filter tasks: {str(e)}")
 
+@_requires_config
 async def fr_filter_epics(
     parent_key: str,
     project_identifier: Optional[Union[int, str]] = None
@@ -2439,6 +2828,7 @@ async def fr_filter_epics(
 
 
 @mcp.tool()
+@_requires_config
 async def fr_get_sprint_by_name(
     project_identifier: Optional[Union[int, str]] = None,
     sprint_name: str = None
@@ -2463,6 +2853,7 @@ async def fr_get_sprint_by_name(
 
 
 @mcp.tool()
+@_requires_config
 async def fr_get_release_by_name(
     project_identifier: Optional[Union[int, str]] = None,
     release_name: str = None
@@ -2487,6 +2878,7 @@ async def fr_get_release_by_name(
 
 
 @mcp.tool()
+@_requires_config
 async def fr_get_tag_by_name(
     project_identifier: Optional[Union[int, str]] = None,
     tag_name: str = None
@@ -2560,6 +2952,7 @@ async def fr_clear_resolution_cache() -> Any:
 
 
 @performance_monitor("fr_save_filter")
+@_requires_config
 async def fr_save_filter(
     label: str,
     query_hash: List[Dict[str, Any]],
@@ -2601,11 +2994,8 @@ async def fr_save_filter(
         Success response with saved filter details or error response
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
         project_id = get_project_identifier(project_identifier)
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         client = get_http_client()
 
         # Create the filter payload
@@ -2619,7 +3009,7 @@ async def fr_save_filter(
         }
 
         # Save the filter
-        url = f"{base_url}/{project_id}/issue_filters"
+        url = _p(project_id, "issue_filters")
         return await make_api_request("POST", url, headers, json_data=filter_payload, client=client)
 
     except Exception as e:
@@ -3070,7 +3460,6 @@ async def _resolve_testcase_field_value(
     value: Any, 
     project_id: Union[int, str],
     client: httpx.AsyncClient,
-    base_url: str,
     headers: Dict[str, str],
     field_metadata: Optional[Dict[str, Any]] = None,
     form_field_options: Optional[Dict[str, Dict[str, int]]] = None
@@ -3085,7 +3474,6 @@ async def _resolve_testcase_field_value(
         value: The value to resolve
         project_id: Resolved project ID
         client: HTTP client instance
-        base_url: API base URL
         headers: Request headers
         field_metadata: Metadata about field types and expected formats from form fields
         form_field_options: Pre-extracted options for all fields (severity, section, etc.)
@@ -3136,7 +3524,7 @@ async def _resolve_testcase_field_value(
                 if ">" in value:
                     logging.info(f"🔗 SECTION: Attempting hierarchical resolution for '{value}'")
                     try:
-                        section_result = await _resolve_section_hierarchy(value, project_id, client, base_url, headers)
+                        section_result = await _resolve_section_hierarchy(value, project_id, client, headers)
                         if section_result:
                             logging.info(f"🔗 SECTION: Resolved hierarchical '{value}' to section ID {section_result}")
                             return section_result
@@ -3145,7 +3533,7 @@ async def _resolve_testcase_field_value(
                 
                 # Fall back to generic section name resolution
                 try:
-                    section_result = await _resolve_name_to_id_generic(value, project_id, client, base_url, headers, "sections")
+                    section_result = await _resolve_name_to_id_generic(value, project_id, client, headers, "sections")
                     if section_result and isinstance(section_result, (int, dict)):
                         resolved_id = section_result.get("id", section_result) if isinstance(section_result, dict) else section_result
                         logging.info(f"🔗 SECTION: Resolved '{value}' to section ID {resolved_id}")
@@ -3170,7 +3558,7 @@ async def _resolve_testcase_field_value(
         elif condition == "creator_id":
             if isinstance(value, str) and not value.isdigit():
                 logging.info(f"👤 CREATOR: Resolving user '{value}' to ID")
-                user_result = await _resolve_user_name_to_id(value, project_id, client, base_url, headers)
+                user_result = await _resolve_user_name_to_id(value, project_id, client, headers)
                 if user_result and isinstance(user_result, int):
                     logging.info(f"👤 CREATOR: Resolved '{value}' to user ID {user_result}")
                     return user_result
@@ -3182,7 +3570,7 @@ async def _resolve_testcase_field_value(
         elif condition == "severity_id" and isinstance(value, str):
             # Try to resolve severity by name using generic API
             try:
-                severity_result = await _resolve_name_to_id_generic(value, project_id, client, base_url, headers, "severities")
+                severity_result = await _resolve_name_to_id_generic(value, project_id, client, headers, "severities")
                 if severity_result and isinstance(severity_result, (int, dict)):
                     resolved_id = severity_result.get("id", severity_result) if isinstance(severity_result, dict) else severity_result
                     logging.info(f"Resolved severity '{value}' to ID {resolved_id}")
@@ -3193,7 +3581,7 @@ async def _resolve_testcase_field_value(
         elif condition == "test_case_type_id" and isinstance(value, str) and not value.isdigit():
             # Resolve test case type name to ID
             try:
-                type_result = await _resolve_name_to_id_generic(value, project_id, client, base_url, headers, "test_case_types")
+                type_result = await _resolve_name_to_id_generic(value, project_id, client, headers, "test_case_types")
                 if type_result and isinstance(type_result, (int, dict)):
                     resolved_id = type_result.get("id", type_result) if isinstance(type_result, dict) else type_result
                     logging.info(f"Resolved test case type '{value}' to ID {resolved_id}")
@@ -3204,7 +3592,7 @@ async def _resolve_testcase_field_value(
         elif condition == "test_case_status_id" and isinstance(value, str) and not value.isdigit():
             # Resolve test case status name to ID
             try:
-                status_result = await _resolve_name_to_id_generic(value, project_id, client, base_url, headers, "test_case_statuses")
+                status_result = await _resolve_name_to_id_generic(value, project_id, client, headers, "test_case_statuses")
                 if status_result and isinstance(status_result, (int, dict)):
                     resolved_id = status_result.get("id", status_result) if isinstance(status_result, dict) else status_result
                     logging.info(f"Resolved test case status '{value}' to ID {resolved_id}")
@@ -3222,11 +3610,63 @@ async def _resolve_testcase_field_value(
         return value
 
 
+def _index_sections(sections: List[Dict[str, Any]]) -> Dict[Tuple[Optional[int], str], List[int]]:
+    """Index a section tree by (parent_id, normalized name) in a single pass.
+    
+    Handles both nested responses (children under a "sections" key) and flat
+    lists where each section carries its parent_id. IDs are appended in
+    depth-first pre-order, the order a recursive scan would visit them.
+    
+    Args:
+        sections: Top-level section objects
+        
+    Returns:
+        Mapping of (parent section ID or None, normalized name) to section IDs
+    """
+    index: Dict[Tuple[Optional[int], str], List[int]] = defaultdict(list)
+    stack = [(None, section) for section in reversed(sections)]
+    while stack:
+        parent_id, section = stack.pop()
+        if not isinstance(section, dict):
+            continue
+        section_id = section.get("id")
+        if parent_id is None:
+            parent_id = section.get("parent_id")
+        index[(parent_id, _norm(section.get("name", "")))].append(section_id)
+        children = section.get("sections") or []
+        stack.extend((section_id, child) for child in reversed(children))
+    # Plain dict, so lookups on a cached index never insert empty buckets
+    return dict(index)
+
+
+def _walk_section_index(
+    index: Dict[Tuple[Optional[int], str], List[int]],
+    path_parts: List[str]
+) -> List[int]:
+    """Return the IDs of sections matching a normalized path, in index order.
+    
+    The frontier starts at the root and is replaced level by level with the
+    children whose name matches the next path part.
+    
+    Args:
+        index: Index built by _index_sections()
+        path_parts: Normalized section names from root to target
+        
+    Returns:
+        Matching section IDs for the final path part, or an empty list
+    """
+    frontier: List[Optional[int]] = [None]
+    for part in path_parts:
+        frontier = [sid for parent in frontier for sid in index.get((parent, part), [])]
+        if not frontier:
+            break
+    return frontier
+
+
 async def _resolve_section_hierarchy(
     hierarchy_path: str,
     project_id: Union[int, str],
     client: httpx.AsyncClient,
-    base_url: str,
     headers: Dict[str, str]
 ) -> Optional[int]:
     """Resolve hierarchical section path (Parent > Child) to section ID.
@@ -3235,7 +3675,6 @@ async def _resolve_section_hierarchy(
         hierarchy_path: Section path like "Authentication > Login" or "UI > Forms > Input Fields"
         project_id: Resolved project ID
         client: HTTP client instance
-        base_url: API base URL
         headers: Request headers
         
     Returns:
@@ -3243,75 +3682,27 @@ async def _resolve_section_hierarchy(
     """
     try:
         # Split the hierarchy path
-        path_parts = [part.strip() for part in hierarchy_path.split(">")]
+        path_parts = [_norm(part) for part in hierarchy_path.split(">")]
         if not path_parts:
             return None
             
         logging.info(f"Resolving section hierarchy: {path_parts}")
         
-        # Get all sections for the project
-        sections_url = f"{base_url}/{project_id}/sections"
-        response = await client.get(sections_url, headers=headers)
-        response.raise_for_status()
-        sections_data = response.json()
-        
-        # Handle nested response structure
-        sections_list = None
-        if isinstance(sections_data, list):
-            sections_list = sections_data
-        elif isinstance(sections_data, dict) and "sections" in sections_data:
-            sections_list = sections_data["sections"]
-        else:
-            logging.warning(f"Unexpected sections response format: {type(sections_data)}")
-            return None
-        
-        # Build a hierarchy map
-        def find_section_by_hierarchy(sections, path_parts, current_level=0):
-            if current_level >= len(path_parts):
-                return None
-                
-            target_name = path_parts[current_level].lower()
-            
-            for section in sections:
-                section_name = section.get("name", "").lower()
-                
-                # Check if this section matches the current level
-                if section_name == target_name:
-                    # If this is the final level, return the section ID
-                    if current_level == len(path_parts) - 1:
-                        return section.get("id")
-                    
-                    # Otherwise, look in child sections
-                    child_sections = section.get("sections", [])
-                    if child_sections:
-                        result = find_section_by_hierarchy(child_sections, path_parts, current_level + 1)
-                        if result:
-                            return result
-            
-            return None
+        # Get the project's section index
+        index = await _get_section_index(client, project_id, headers)
         
-        # Find the section ID using hierarchy
-        section_id = find_section_by_hierarchy(sections_list, path_parts)
-        if section_id:
+        frontier = _walk_section_index(index, path_parts)
+        if frontier:
+            section_id = frontier[0]
             logging.info(f"Found section ID {section_id} for hierarchy '{hierarchy_path}'")
             return section_id
         
         # If hierarchical search failed, try exact name match on the final part
-        final_section_name = path_parts[-1].lower()
-        def find_section_by_name_recursive(sections, target_name):
-            for section in sections:
-                if section.get("name", "").lower() == target_name:
-                    return section.get("id")
-                
-                # Check child sections recursively
-                child_sections = section.get("sections", [])
-                if child_sections:
-                    result = find_section_by_name_recursive(child_sections, target_name)
-                    if result:
-                        return result
-            return None
-        
-        fallback_id = find_section_by_name_recursive(sections_list, final_section_name)
+        final_section_name = path_parts[-1]
+        fallback_id = next(
+            (ids[0] for (_, name), ids in index.items() if name == final_section_name),
+            None
+        )
         if fallback_id:
             logging.info(f"Found section ID {fallback_id} using fallback name match for '{final_section_name}'")
             return fallback_id
@@ -3326,6 +3717,7 @@ async def _resolve_section_hierarchy(
 
 @mcp.tool()
 @performance_monitor("fr_testcase_filter_summary")
+@_requires_config
 async def fr_testcase_filter_summary(
     project_identifier: Optional[Union[int, str]] = None,
     filter_rules: Optional[List[Dict[str, Any]]] = None,
@@ -3446,11 +3838,9 @@ async def fr_testcase_filter_summary(
         )
     """
     try:
-        # Validate environment variables and initialize API objects once
-        env_data = validate_environment()
+        # Initialize API objects once
         project_id = get_project_identifier(project_identifier)
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         client = get_http_client()
 
         logging.info("=== Starting testcase filter summary with explicit field mapping ===")
@@ -3635,8 +4025,7 @@ async def fr_testcase_filter_summary(
             # Parse query based on format
             if query_format == "json":
                 if isinstance(query, str):
-                    import json
-                    query_dict = json.loads(query)
+                    query_dict = orjson.loads(query)
                 else:
                     query_dict = query
                 query_pairs = list(query_dict.items())
@@ -3690,7 +4079,7 @@ async def fr_testcase_filter_summary(
                         
                         # Step 4: Resolve values to IDs using intelligent form field analysis
                         final_value = await _resolve_testcase_field_value(
-                            condition, value, project_id, client, base_url, headers,
+                            condition, value, project_id, client, headers,
                             field_metadata, form_field_options
                         )
                         
@@ -3698,7 +4087,7 @@ async def fr_testcase_filter_summary(
                         _add_query_hash_value(params, i, final_value)
                 
                 # Make API request with converted query
-                url = f"{base_url}/{project_id}/test_cases"
+                url = _p(project_id, "test_cases")
                 result = await make_api_request("GET", url, headers, params=params, client=client)
                 
                 # Add AI summary to the result
@@ -3724,7 +4113,7 @@ async def fr_testcase_filter_summary(
                     
                     # Resolve values to IDs using intelligent form field analysis
                     final_value = await _resolve_testcase_field_value(
-                        condition, value, project_id, client, base_url, headers,
+                        condition, value, project_id, client, headers,
                         field_metadata, form_field_options
                     )
                     
@@ -3732,7 +4121,7 @@ async def fr_testcase_filter_summary(
                     _add_query_hash_value(params, i, final_value)
             
             # Make API request with query_hash
-            url = f"{base_url}/{project_id}/test_cases"
+            url = _p(project_id, "test_cases")
             result = await make_api_request("GET", url, headers, params=params, client=client)
             
             # Add AI summary to the result
@@ -3746,7 +4135,7 @@ async def fr_testcase_filter_summary(
         # Handle legacy filter_rules format (convert to query_hash)
         if not filter_rules:
             # No filtering criteria provided, return all test cases with pagination/sorting
-            url = f"{base_url}/{project_id}/test_cases"
+            url = _p(project_id, "test_cases")
             result = await make_api_request("GET", url, headers, params=params, client=client)
             
             # Add AI summary to the result
@@ -3777,7 +4166,7 @@ async def fr_testcase_filter_summary(
                 
                 # Resolve values to IDs using intelligent form field analysis
                 final_value = await _resolve_testcase_field_value(
-                    condition, value, project_id, client, base_url, headers,
+                    condition, value, project_id, client, headers,
                     field_metadata, form_field_options
                 )
                 
@@ -3786,7 +4175,7 @@ async def fr_testcase_filter_summary(
 
         # Step 6: Make the testcase filter API request
         logging.info("Step 6: Making API request to fetch filtered testcases")
-        url = f"{base_url}/{project_id}/test_cases"
+        url = _p(project_id, "test_cases")
         result = await make_api_request("GET", url, headers, params=params, client=client)
         
         # Add AI summary to the result
@@ -3803,6 +4192,7 @@ async def fr_testcase_filter_summary(
 
 @mcp.tool()
 @performance_monitor("fr_get_issue_form_fields")
+@_requires_config
 async def fr_get_issue_form_fields(
     project_identifier: Optional[Union[int, str]] = None,
     issue_type_id: Optional[Union[int, str]] = None
@@ -3820,18 +4210,12 @@ async def fr_get_issue_form_fields(
         Form fields data with available fields and their possible values
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        if "error" in env_data:
-            return env_data
-        
         project_id = get_project_identifier(project_identifier)
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         client = get_http_client()
 
         # Get issue form fields
-        url = f"{base_url}/{project_id}/issues/form"
+        url = _p(project_id, "issues", "form")
         
         # Add issue type parameter if provided
         params = {}
@@ -3839,7 +4223,7 @@ async def fr_get_issue_form_fields(
             # Resolve issue type name to ID if needed
             if isinstance(issue_type_id, str) and not issue_type_id.isdigit():
                 issue_type_data = await _resolve_name_to_id_generic(
-                    issue_type_id, project_id, client, base_url, headers, "issue_types"
+                    issue_type_id, project_id, client, headers, "issue_types"
                 )
                 if isinstance(issue_type_data, dict) and "id" in issue_type_data:
                     params["issue_type_id"] = issue_type_data["id"]
@@ -3856,6 +4240,7 @@ async def fr_get_issue_form_fields(
 
 @mcp.tool()
 @performance_monitor("fr_get_testcase_form_fields")
+@_requires_config
 async def fr_get_testcase_form_fields(
     project_identifier: Optional[Union[int, str]] = None
 ) -> Any:
@@ -3871,18 +4256,12 @@ async def fr_get_testcase_form_fields(
         Form fields data with available filter conditions and their possible values
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        if "error" in env_data:
-            return env_data
-        
         project_id = get_project_identifier(project_identifier)
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         client = get_http_client()
 
         # Get test case form fields
-        url = f"{base_url}/{project_id}/forms/project_test_case_form"
+        url = _p(project_id, "forms", "project_test_case_form")
         return await make_api_request("GET", url, headers, client=client)
 
     except Exception as e:
@@ -3891,6 +4270,7 @@ async def fr_get_testcase_form_fields(
 
 @mcp.tool()
 @performance_monitor("fr_get_all_issue_type_form_fields")
+@_requires_config
 async def fr_get_all_issue_type_form_fields(
     project_identifier: Optional[Union[int, str]] = None
 ) -> Any:
@@ -3906,18 +4286,12 @@ async def fr_get_all_issue_type_form_fields(
         Dictionary with issue type names as keys and their form fields as values
     """
     try:
-        # Validate environment variables
-        env_data = validate_environment()
-        if "error" in env_data:
-            return env_data
-        
         project_id = get_project_identifier(project_identifier)
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         client = get_http_client()
 
         # First, get all issue types
-        issue_types_url = f"{base_url}/{project_id}/issue_types"
+        issue_types_url = _p(project_id, "issue_types")
         issue_types_data = await make_api_request("GET", issue_types_url, headers, client=client)
         
         if not isinstance(issue_types_data, list):
@@ -3932,7 +4306,7 @@ async def fr_get_all_issue_type_form_fields(
             
             if issue_type_id:
                 try:
-                    form_url = f"{base_url}/{project_id}/issues/form"
+                    form_url = _p(project_id, "issues", "form")
                     form_data = await make_api_request(
                         "GET", form_url, headers, client=client, 
                         params={"issue_type_id": issue_type_id}
@@ -3972,7 +4346,7 @@ async def fr_clear_testcase_form_cache() -> Any:
 
 @mcp.tool()
 async def fr_clear_all_caches() -> Any:
-    """Clear all caches (custom fields, lookup data, and resolution cache).
+    """Clear all caches (custom fields, lookup data, resolution, issue types, sections and responses).
     
     This is useful when you want to refresh all cached data
     without restarting the server.
@@ -3984,6 +4358,8 @@ async def fr_clear_all_caches() -> Any:
         _clear_custom_fields_cache()
         _clear_lookup_cache()
         _clear_resolution_cache()
+        _clear_project_config_cache()
+        _clear_response_cache()
         
         # Clear test case form cache
         global _testcase_form_cache
@@ -3996,6 +4372,7 @@ async def fr_clear_all_caches() -> Any:
 
 @mcp.tool()
 @performance_monitor("fr_get_testrun_summary")
+@_requires_config
 async def fr_get_testrun_summary(
     test_run_id: Union[int, str],
     project_identifier: Optional[Union[int, str]] = None
@@ -4028,17 +4405,13 @@ async def fr_get_testrun_summary(
         # }
     """
     try:
-        env_data = validate_environment()
-        if "error" in env_data:
-            return env_data
-            
         if not test_run_id:
             return create_error_response("test_run_id is required")
             
         project_id = get_project_identifier(project_identifier)
-        url = f"{env_data['base_url']}/{project_id}/test_runs/{test_run_id}"
+        url = _p(project_id, "test_runs", test_run_id)
         
-        response = await make_api_request("GET", url, env_data["headers"], client=get_http_client())
+        response = await make_api_request("GET", url, _AUTH_HEADER, client=get_http_client())
         if "error" in response:
             return response
             
@@ -4105,6 +4478,7 @@ async def fr_close_http_client() -> Dict[str, Any]:
 
 
 @mcp.tool()
+@_requires_config
 async def fr_add_testcases_to_testrun(
     project_identifier: Optional[Union[int, str]] = None, 
     test_run_id: Union[int, str] = None,
@@ -4129,9 +4503,7 @@ async def fr_add_testcases_to_testrun(
         Test run update result or error response
     """
     try:
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
     except ValueError as e:
         return create_error_response(str(e))
@@ -4139,61 +4511,64 @@ async def fr_add_testcases_to_testrun(
     if test_run_id is None:
         return create_error_response("test_run_id is required")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # Resolve test case keys to IDs (if provided)
-            resolved_test_case_ids: List[str] = []
-            if test_case_keys:
-                for key in test_case_keys:
-                    tc_url = f"{base_url}/{project_id}/test_cases/{key}"
-                    tc_data = await make_api_request("GET", tc_url, headers, client=client)
-                    if isinstance(tc_data, dict) and "id" in tc_data:
-                        resolved_test_case_ids.append(str(tc_data["id"]))
-                    else:
-                        return create_error_response(f"Unexpected test case response structure for key '{key}'", tc_data)
-
-            # Resolve section hierarchy paths to IDs
-            resolved_section_subtree_ids: List[str] = []
-            if section_hierarchy_paths:
-                for path in section_hierarchy_paths:
-                    section_ids_from_path = await resolve_section_hierarchy_to_ids(client, base_url, project_id, headers, path)
-                    resolved_section_subtree_ids.extend([str(sid) for sid in section_ids_from_path])
-
-            # Combine resolved section subtree IDs with any provided directly
-            all_section_subtree_ids = resolved_section_subtree_ids + [str(sid) for sid in (section_subtree_ids or [])]
-
-            # Build payload with resolved IDs
-            payload = {
-                "filter_rule": filter_rule or [],
-                "test_case_ids": resolved_test_case_ids,
-                "section_subtree_ids": all_section_subtree_ids,
-                "section_ids": [str(sid) for sid in (section_ids or [])]
-            }
+    client = get_http_client()
+    try:
+        # Resolve test case keys to IDs (if provided)
+        # Fetch test cases and the root section tree concurrently; every
+        # hierarchy path is then resolved against the same in-memory index
+        fetches = [asyncio.gather(*[
+            testcase_id_from_key(client, project_id, headers, key)
+            for key in (test_case_keys or [])
+        ])]
+        if section_hierarchy_paths:
+            fetches.append(_get_section_index(client, project_id, headers))
+        fetched = await asyncio.gather(*fetches)
+        resolved_test_case_ids: List[str] = [str(tc_id) for tc_id in fetched[0]]
+        section_index = fetched[1] if section_hierarchy_paths else None
+
+        # Resolve section hierarchy paths to IDs
+        resolved_section_subtree_ids: List[str] = []
+        if section_hierarchy_paths:
+            for path in section_hierarchy_paths:
+                section_ids_from_path = await resolve_section_hierarchy_to_ids(
+                    client, project_id, headers, path, section_index=section_index
+                )
+                resolved_section_subtree_ids.extend([str(sid) for sid in section_ids_from_path])
 
-            # Make the PUT request
-            url = f"{base_url}/{project_id}/test_runs/{test_run_id}/test_cases"
-            return await make_api_request("PUT", url, headers, json_data=payload, client=client)
+        # Combine resolved section subtree IDs with any provided directly
+        all_section_subtree_ids = resolved_section_subtree_ids + [str(sid) for sid in (section_subtree_ids or [])]
 
-        except httpx.HTTPStatusError as e:
-            return create_error_response(f"Failed to add test cases to test run: {str(e)}", e.response.json() if e.response else None)
-        except Exception as e:
-            return create_error_response(f"An unexpected error occurred: {str(e)}")
+        # Build payload with resolved IDs
+        payload = {
+            "filter_rule": filter_rule or [],
+            "test_case_ids": resolved_test_case_ids,
+            "section_subtree_ids": all_section_subtree_ids,
+            "section_ids": [str(sid) for sid in (section_ids or [])]
+        }
+
+        # Make the PUT request
+        url = _p(project_id, "test_runs", test_run_id, "test_cases")
+        return await make_api_request("PUT", url, headers, json_data=payload, client=client)
+
+    except httpx.HTTPStatusError as e:
+        return create_error_response(f"Failed to add test cases to test run: {str(e)}", _safe_json(e.response))
+    except Exception as e:
+        return create_error_response(f"An unexpected error occurred: {str(e)}")
 
 
 # Missing helper functions
 async def _find_item_by_name(
     client: httpx.AsyncClient,
-    base_url: str,
     project_id: Union[int, str],
     headers: Dict[str, str],
     data_type: str,
     item_name: str
 ) -> Dict[str, Any]:
     """Find an item by name in the given data type."""
-    url = f"{base_url}/{project_id}/{data_type}"
+    url = _p(project_id, data_type)
     response = await client.get(url, headers=headers)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
     
     # Handle both direct list and nested object responses
     items_list = None
@@ -4230,26 +4605,24 @@ async def _generic_lookup_by_name(
         return create_error_response(f"{name_param} is required")
     
     try:
-        env_data = validate_environment()
-        base_url = env_data["base_url"]
-        headers = env_data["headers"]
+        headers = _AUTH_HEADER
         project_id = get_project_identifier(project_identifier)
     except ValueError as e:
         return create_error_response(str(e))
 
-    async with httpx.AsyncClient() as client:
-        try:
-            item = await _find_item_by_name(client, base_url, project_id, headers, data_type, item_name)
-            
-            return {
-                data_type.rstrip('s'): item,  # Remove 's' from plural for response key
-                "message": f"Found {data_type.rstrip('s')} '{item_name}' with ID {item.get('id')}"
-            }
-            
-        except ValueError as e:
-            return create_error_response(str(e))
-        except Exception as e:
-            return create_error_response(f"An unexpected error occurred: {str(e)}")
+    client = get_http_client()
+    try:
+        item = await _find_item_by_name(client, project_id, headers, data_type, item_name)
+        
+        return {
+            data_type.rstrip('s'): item,  # Remove 's' from plural for response key
+            "message": f"Found {data_type.rstrip('s')} '{item_name}' with ID {item.get('id')}"
+        }
+        
+    except ValueError as e:
+        return create_error_response(str(e))
+    except Exception as e:
+        return create_error_response(f"An unexpected error occurred: {str(e)}")
 
 
 def _clear_custom_fields_cache() -> Dict[str, Any]:
@@ -4273,16 +4646,30 @@ def _clear_resolution_cache() -> Dict[str, Any]:
     return {"message": "Resolution cache cleared successfully"}
 
 
+def _clear_project_config_cache() -> Dict[str, Any]:
+    """Clear the issue types and sections caches."""
+    _issue_types_cache.clear()
+    _sections_cache.clear()
+    return {"message": "Project configuration cache cleared successfully"}
+
+
+def _clear_response_cache() -> Dict[str, Any]:
+    """Clear the cached GET responses, key-to-id resolutions and ETags."""
+    _response_cache.clear()
+    _id_cache.clear()
+    _etag_cache.clear()
+    return {"message": "Response cache cleared successfully"}
+
+
 async def _resolve_name_to_id_generic(
     name: str,
     project_id: Union[int, str],
     client: httpx.AsyncClient,
-    base_url: str,
     headers: Dict[str, str],
     data_type: str
 ) -> int:
     """Generic function to resolve names to IDs."""
-    item = await _find_item_by_name(client, base_url, project_id, headers, data_type, name)
+    item = await _find_item_by_name(client, project_id, headers, data_type, name)
     return item["id"]
 
 
@@ -4290,17 +4677,16 @@ async def _resolve_user_name_to_id(
     user_identifier: str,
     project_id: Union[int, str],
     client: httpx.AsyncClient,
-    base_url: str,
     headers: Dict[str, str]
 ) -> int:
     """Resolve user name or email to user ID."""
     # First try to find by exact name match
     try:
-        url = f"{base_url}/{project_id}/users"
+        url = _p(project_id, "users")
         params = {"q": user_identifier}
         response = await client.get(url, headers=headers, params=params)
         response.raise_for_status()
-        users_data = response.json()
+        users_data = orjson.loads(response.content)
         
         # Handle nested response structure {"users": [...], "meta": {...}}
         users_list = None
@@ -4313,10 +4699,11 @@ async def _resolve_user_name_to_id(
         
         if users_list:
             # Look for exact name match first
+            target = _norm(user_identifier)
             for user in users_list:
-                if user.get("name", "").lower() == user_identifier.lower():
+                if _norm(user.get("name", "")) == target:
                     return user["id"]
-                if user.get("email", "").lower() == user_identifier.lower():
+                if _norm(user.get("email", "")) == target:
                     return user["id"]
             
             # If no exact match, return the first result
@@ -4331,7 +4718,6 @@ async def _resolve_issue_key_to_id(
     issue_key: str,
     project_id: Union[int, str],
     client: httpx.AsyncClient,
-    base_url: str,
     headers: Dict[str, str]
 ) -> int:
     """Resolve issue key (e.g., 'FS-123456') to issue ID.
@@ -4340,7 +4726,6 @@ async def _resolve_issue_key_to_id(
         issue_key: Issue key to resolve (e.g., 'FS-123456')
         project_id: Project ID
         client: HTTP client instance
-        base_url: Base API URL
         headers: Request headers
         
     Returns:
@@ -4352,11 +4737,11 @@ async def _resolve_issue_key_to_id(
             return int(issue_key)
         
         # Try to get the issue by key
-        url = f"{base_url}/{project_id}/issues/{issue_key}"
+        url = _p(project_id, "issues", issue_key)
         response = await client.get(url, headers=headers)
         response.raise_for_status()
         
-        issue_data = response.json()
+        issue_data = orjson.loads(response.content)
         
         # Handle both direct issue response and nested issue response
         if isinstance(issue_data, dict):
@@ -4419,7 +4804,6 @@ async def _resolve_query_fields(
     query_pairs: List[tuple],
     project_id: Union[int, str],
     client: httpx.AsyncClient,
-    base_url: str,
     headers: Dict[str, str],
     custom_fields: List[Dict[str, Any]],
     field_label_to_name_map: Optional[Dict[str, str]] = None
@@ -4454,14 +4838,14 @@ async def _resolve_query_fields(
     
     # Field resolution mapping
     field_resolvers = {
-        "owner_id": lambda value: _resolve_user_name_to_id(value, project_id, client, base_url, headers),
-        "status_id": lambda value: _resolve_name_to_id_generic(value, project_id, client, base_url, headers, "statuses"),
-        "issue_type_id": lambda value: _resolve_name_to_id_generic(value, project_id, client, base_url, headers, "issue_types"),
-        "sprint_id": lambda value: _resolve_name_to_id_generic(value, project_id, client, base_url, headers, "sprints"),
-        "release_id": lambda value: _resolve_name_to_id_generic(value, project_id, client, base_url, headers, "releases"),
+        "owner_id": lambda value: _resolve_user_name_to_id(value, project_id, client, headers),
+        "status_id": lambda value: _resolve_name_to_id_generic(value, project_id, client, headers, "statuses"),
+        "issue_type_id": lambda value: _resolve_name_to_id_generic(value, project_id, client, headers, "issue_types"),
+        "sprint_id": lambda value: _resolve_name_to_id_generic(value, project_id, client, headers, "sprints"),
+        "release_id": lambda value: _resolve_name_to_id_generic(value, project_id, client, headers, "releases"),
         "sub_project_id": lambda value: _resolve_subproject_name_to_id(value, project_id),
-        "parent_id": lambda value: _resolve_issue_key_to_id(value, project_id, client, base_url, headers),
-        "epic_id": lambda value: _resolve_issue_key_to_id(value, project_id, client, base_url, headers),
+        "parent_id": lambda value: _resolve_issue_key_to_id(value, project_id, client, headers),
+        "epic_id": lambda value: _resolve_issue_key_to_id(value, project_id, client, headers),
     }
     
     for field_name, value in mapped_query_pairs:
@@ -4476,7 +4860,7 @@ async def _resolve_query_fields(
                 if isinstance(value, str):
                     try:
                         resolved_value = await _resolve_custom_field_value_optimized(
-                            field_name, value, project_id, client, base_url, headers
+                            field_name, value, project_id, client, headers
                         )
                         resolved_query[field_name] = resolved_value
                     except Exception:
@@ -4510,7 +4894,6 @@ async def _resolve_custom_field_value_optimized(
     value: str,
     project_id: Union[int, str],
     client: httpx.AsyncClient,
-    base_url: str,
     headers: Dict[str, str]
 ) -> str:
     """Resolve custom field values to IDs."""
@@ -4518,6 +4901,7 @@ async def _resolve_custom_field_value_optimized(
     return value
 
 @mcp.tool()
+@_requires_config
 async def get_subproject_id_by_name(
     sub_project_name: str,
     project_identifier: Optional[Union[int, str]] = None
@@ -4548,16 +4932,13 @@ async def get_subproject_id_by_name(
         if not sub_project_name:
             return {"error": "sub_project_name is required"}
         
-        headers = {
-            "Authorization": f"Token {FRESHRELEASE_API_KEY}",
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADER
         
         client = get_http_client()
         
         # Get all sub-projects to find the ID by name
         # Handle both project keys (like "FS", "PROJ") and project IDs (like 123)
-        sub_projects_url = f"https://{FRESHRELEASE_DOMAIN}/{project_id}/sub_projects"
+        sub_projects_url = _p(project_id, "sub_projects")
         
         logging.info(f"Fetching sub-projects from: {sub_projects_url}")
         sub_projects_response = await client.get(sub_projects_url, headers=headers)
@@ -4569,7 +4950,7 @@ async def get_subproject_id_by_name(
                 "details": sub_projects_response.text
             }
         
-        sub_projects_data = sub_projects_response.json()
+        sub_projects_data = orjson.loads(sub_projects_response.content)
         
         # Handle the standard sub-projects API response structure
         if isinstance(sub_projects_data, dict) and "sub_projects" in sub_projects_data:
@@ -4611,6 +4992,7 @@ async def get_subproject_id_by_name(
 
 @mcp.tool()
 @performance_monitor("fr_get_current_subproject_sprint")
+@_requires_config
 async def fr_get_current_subproject_sprint(
     sub_project_name: str
 ) -> Dict[str, Any]:
@@ -4645,17 +5027,14 @@ async def fr_get_current_subproject_sprint(
         # Get project identifier (avoid redundant call since utility function already calls this)
         project_id = get_project_identifier()
         
-        headers = {
-            "Authorization": f"Token {FRESHRELEASE_API_KEY}",
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADER
         
         client = get_http_client()
         
         # Step 2: Get active sprints for the sub-project
         # Handle both project keys (like "FS", "PROJ") and project IDs (like 123)
         # The sprints API can accept both project keys and IDs
-        sprints_url = f"https://{FRESHRELEASE_DOMAIN}/{project_id}/sprints"
+        sprints_url = _p(project_id, "sprints")
         sprints_params = {
             "primary_workspace_id": sub_project_id,
             "query_hash[0][condition]": "state",
@@ -4675,7 +5054,7 @@ async def fr_get_current_subproject_sprint(
                 "details": sprints_response.text
             }
         
-        sprints_data = sprints_response.json()
+        sprints_data = orjson.loads(sprints_response.content)
         sprints = sprints_data.get("sprints", [])
         
         if not sprints:
@@ -4702,6 +5081,17 @@ async def fr_get_current_subproject_sprint(
 
 def main():
     logging.info("Starting Freshrelease MCP server")
+    # uvloop is an optional extra and does not support Windows
+    if sys.platform != "win32":
+        try:
+            import uvloop  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            # Same as mcp.run(transport='stdio'), on a uvloop event loop
+            import anyio
+            anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
+            return
     mcp.run(transport='stdio')
 
 if __name__ == "__main__":
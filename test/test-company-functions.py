@@ -1,10 +1,27 @@
 import unittest
+from unittest import mock
+import asyncio
 import os
 import sys
 
+import httpx
+
 # Add the parent directory to the path so we can import the module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.freshrelease_mcp.server import parse_link_header
+from src.freshrelease_mcp import server
+from src.freshrelease_mcp.server import parse_link_header, _index_sections, _KeyBatcher
+
+BASE_URL = "https://example.freshrelease.com"
+
+def _mock_client(handler, calls):
+    """Build a client whose requests are answered by handler and recorded in calls."""
+    async def record(request):
+        calls.append(request.url.path)
+        result = handler(request)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+    return httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(record))
 
 class TestParseHeaderFunction(unittest.TestCase):
     def test_parse_link_header(self):
@@ -13,6 +30,11 @@ class TestParseHeaderFunction(unittest.TestCase):
         self.assertEqual(result.get('next'), 2)
         self.assertEqual(result.get('prev'), 1)
 
+    def test_parse_link_header_ignores_per_page(self):
+        header = '<https://example.com/issues?per_page=100&page=3>; rel="next"'
+        result = parse_link_header(header)
+        self.assertEqual(result.get('next'), 3)
+
     def test_parse_link_header_empty(self):
         result = parse_link_header("")
         self.assertEqual(result, {"next": None, "prev": None})
@@ -21,5 +43,130 @@ class TestParseHeaderFunction(unittest.TestCase):
         result = parse_link_header("invalid format")
         self.assertEqual(result, {"next": None, "prev": None})
 
+class TestIndexSectionsFunction(unittest.TestCase):
+    def test_index_nested_sections(self):
+        sections = [
+            {"id": 1, "name": "Auth", "sections": [{"id": 2, "name": " Login "}]},
+            {"id": 3, "name": "auth"},
+        ]
+        index = _index_sections(sections)
+        self.assertEqual(index[(None, "auth")], [1, 3])
+        self.assertEqual(index[(1, "login")], [2])
+
+    def test_index_flat_sections(self):
+        sections = [
+            {"id": 1, "name": "Auth", "parent_id": None},
+            {"id": 2, "name": "Login", "parent_id": 1},
+        ]
+        index = _index_sections(sections)
+        self.assertEqual(index[(None, "auth")], [1])
+        self.assertEqual(index[(1, "login")], [2])
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        server._clear_response_cache()
+        self.calls = []
+
+    def _handler(self, request):
+        if request.method == "PUT":
+            return httpx.Response(200, json={"test_cases": []})
+        return httpx.Response(200, json={"id": 7, "key": request.url.path.rsplit("/", 1)[-1]})
+
+    async def test_second_read_within_ttl_is_cached(self):
+        client = _mock_client(self._handler, self.calls)
+        first = await server._fetch_issue(client, "FS", {}, "FS-1")
+        second = await server._fetch_issue(client, "FS", {}, "FS-1")
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, ["/FS/issues/FS-1"])
+
+    async def test_id_lookup_uses_cached_full_response(self):
+        client = _mock_client(self._handler, self.calls)
+        await server._fetch_testcase(client, "FS", {}, "FS-1")
+        self.assertEqual(await server.testcase_id_from_key(client, "FS", {}, "FS-1"), 7)
+        self.assertEqual(self.calls, ["/FS/test_cases/FS-1"])
+
+    async def test_link_testcase_issues_drops_linked_entries(self):
+        client = _mock_client(self._handler, self.calls)
+        await server._fetch_testcase(client, "FS", {}, "FS-1")
+        await server._fetch_testcase(client, "FS", {}, "FS-2")
+        await server._fetch_issue(client, "FS", {}, "FS-9")
+        with mock.patch.multiple(server, FRESHRELEASE_DOMAIN="example.freshrelease.com",
+                                 FRESHRELEASE_API_KEY="key", get_http_client=lambda: client):
+            result = await server.fr_link_testcase_issues("FS", ["FS-1"], ["FS-9"])
+        self.assertNotIn("error", result)
+        self.assertNotIn("/FS/test_cases/FS-1", server._response_cache)
+        self.assertNotIn("/FS/issues/FS-9", server._response_cache)
+        self.assertIn("/FS/test_cases/FS-2", server._response_cache)
+        # Ids do not change on a link, so the resolutions stay cached
+        self.assertIn("/FS/test_cases/FS-1", server._id_cache)
+
+class TestConditionalGet(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        server._clear_response_cache()
+        self.calls = []
+
+    async def test_not_modified_returns_cached_body(self):
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=[{"id": 1, "name": "Auth"}], headers={"ETag": '"v1"'})
+        client = _mock_client(handler, self.calls)
+        first = await server._conditional_get(client, "/FS/sections", {})
+        second = await server._conditional_get(client, "/FS/sections", {})
+        self.assertIs(second, first)
+        self.assertEqual(len(self.calls), 2)
+        # Cached payloads are returned as the API sent them
+        self.assertEqual(second, [{"id": 1, "name": "Auth"}])
+
+    async def test_response_without_etag_evicts_entry(self):
+        responses = [
+            httpx.Response(200, json={"users": []}, headers={"ETag": '"v1"'}),
+            httpx.Response(200, json={"users": [{"id": 2}]}),
+        ]
+        client = _mock_client(lambda request: responses.pop(0), self.calls)
+        await server._conditional_get(client, "/FS/users", {}, params={"q": "bob"})
+        self.assertIn("/FS/users?q=bob", server._etag_cache)
+        data = await server._conditional_get(client, "/FS/users", {}, params={"q": "bob"})
+        self.assertEqual(data, {"users": [{"id": 2}]})
+        self.assertNotIn("/FS/users?q=bob", server._etag_cache)
+
+class TestKeyBatcher(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        server._clear_response_cache()
+        self.calls = []
+
+    async def test_concurrent_lookups_share_one_request(self):
+        client = _mock_client(lambda request: httpx.Response(200, json={"id": 7}), self.calls)
+        batcher = _KeyBatcher()
+        responses = await asyncio.gather(*[batcher.get(client, "/FS/test_cases/FS-1", {}) for _ in range(5)])
+        self.assertEqual(self.calls, ["/FS/test_cases/FS-1"])
+        self.assertTrue(all(response is responses[0] for response in responses))
+
+    async def test_not_found_reaches_every_waiter(self):
+        client = _mock_client(lambda request: httpx.Response(404, json={"errors": ["not found"]}), self.calls)
+        results = await asyncio.gather(*[
+            server.testcase_id_from_key(client, "FS", {}, "FS-404") for _ in range(3)
+        ], return_exceptions=True)
+        self.assertEqual(self.calls, ["/FS/test_cases/FS-404"])
+        for result in results:
+            self.assertIsInstance(result, httpx.HTTPStatusError)
+            self.assertEqual(result.response.status_code, 404)
+
+    async def test_cancelled_waiter_keeps_shared_request(self):
+        async def slow(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"id": 7})
+        client = _mock_client(slow, self.calls)
+        batcher = _KeyBatcher()
+        cancelled = asyncio.ensure_future(batcher.get(client, "/FS/test_cases/FS-1", {}))
+        waiter = asyncio.ensure_future(batcher.get(client, "/FS/test_cases/FS-1", {}))
+        # Let the batch window close so the shared request is in flight
+        await asyncio.sleep(0.02)
+        cancelled.cancel()
+        response = await waiter
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(self.calls, ["/FS/test_cases/FS-1"])
+
 if __name__ == "__main__":
     unittest.main(argv=['first-arg-is-ignored'], exit=False)
\ No newline at end of file